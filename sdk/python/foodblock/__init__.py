@@ -1,14 +1,14 @@
 PROTOCOL_VERSION = '0.5.0'
 
-from .block import create, update, merge_update, compute_hash
-from .chain import chain, tree, head
-from .verify import generate_keypair, sign, verify
-from .canonical import canonical
+from .block import create, update, merge_update, compute_hash, compute_hashes
+from .chain import chain, tree, head, chain_sync, InMemoryStore
+from .verify import generate_keypair, sign, verify, sign_many, verify_many
+from .canonical import canonical, canonical_bytes
 from .agent import create_agent, create_draft, approve_draft, load_agent
 from .query import query, Query
 from .tombstone import tombstone
 from .validate import validate
-from .encrypt import encrypt, decrypt, generate_encryption_keypair
+from .encrypt import encrypt, decrypt, generate_encryption_keypair, EncryptSession
 from .offline import offline_queue, OfflineQueue
 from .alias import registry, Registry
 from .notation import parse, parse_all, format_block
@@ -21,21 +21,21 @@ from .forward import forward, recall, downstream
 from .merge import detect_conflict, merge, auto_merge
 from .merkle import merkleize, selective_disclose, verify_proof
 from .snapshot import create_snapshot, verify_snapshot, summarize
-from .attestation import attest, dispute, trace_attestations, trust_score
+from .attestation import attest, dispute, trace_attestations, trust_score, trust_scores, build_attestation_index
 from .trust import compute_trust, connection_density, create_trust_policy, DEFAULT_WEIGHTS
 from .seed import seed_vocabularies, seed_templates, seed_all
 from .fb import fb
 
 __all__ = [
-    'create', 'update', 'merge_update', 'compute_hash',
-    'chain', 'tree', 'head',
-    'generate_keypair', 'sign', 'verify',
-    'canonical',
+    'create', 'update', 'merge_update', 'compute_hash', 'compute_hashes',
+    'chain', 'tree', 'head', 'chain_sync', 'InMemoryStore',
+    'generate_keypair', 'sign', 'verify', 'sign_many', 'verify_many',
+    'canonical', 'canonical_bytes',
     'create_agent', 'create_draft', 'approve_draft', 'load_agent',
     'query', 'Query',
     'tombstone',
     'validate',
-    'encrypt', 'decrypt', 'generate_encryption_keypair',
+    'encrypt', 'decrypt', 'generate_encryption_keypair', 'EncryptSession',
     'offline_queue', 'OfflineQueue',
     'registry', 'Registry',
     'parse', 'parse_all', 'format_block',
@@ -48,7 +48,7 @@ __all__ = [
     'detect_conflict', 'merge', 'auto_merge',
     'merkleize', 'selective_disclose', 'verify_proof',
     'create_snapshot', 'verify_snapshot', 'summarize',
-    'attest', 'dispute', 'trace_attestations', 'trust_score',
+    'attest', 'dispute', 'trace_attestations', 'trust_score', 'trust_scores', 'build_attestation_index',
     'compute_trust', 'connection_density', 'create_trust_policy', 'DEFAULT_WEIGHTS',
     'seed_vocabularies', 'seed_templates', 'seed_all',
     'fb',
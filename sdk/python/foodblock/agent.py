@@ -6,7 +6,7 @@ create drafts for human approval, and operate on behalf of a human operator.
 """
 
 from .block import create
-from .verify import generate_keypair, sign
+from .verify import generate_keypair, sign, sign_many
 
 
 def create_agent(name, operator_hash, opts=None):
@@ -21,7 +21,7 @@ def create_agent(name, operator_hash, opts=None):
         opts: Optional dict with 'model', 'capabilities', 'state' keys
 
     Returns:
-        dict with 'block', 'keypair', 'author_hash', 'sign' (callable)
+        dict with 'block', 'keypair', 'author_hash', 'sign' and 'sign_many' (callables)
     """
     if not name or not isinstance(name, str):
         raise ValueError('FoodBlock Agent: name is required')
@@ -44,15 +44,19 @@ def create_agent(name, operator_hash, opts=None):
     def agent_sign(foodblock):
         return sign(foodblock, block['hash'], keypair['private_key'])
 
+    def agent_sign_many(foodblocks):
+        return sign_many(foodblocks, block['hash'], keypair['private_key'])
+
     return {
         'block': block,
         'keypair': keypair,
         'author_hash': block['hash'],
         'sign': agent_sign,
+        'sign_many': agent_sign_many,
     }
 
 
-def create_draft(agent, type_, state=None, refs=None):
+def create_draft(agent, type_, state=None, refs=None, defer_signing=False):
     """
     Create a draft block on behalf of an agent.
 
@@ -64,6 +68,8 @@ def create_draft(agent, type_, state=None, refs=None):
         type_: Block type (e.g. 'transfer.order')
         state: Block state dict
         refs: Block refs dict
+        defer_signing: If True, 'signed' is None; sign a batch of drafts
+            later with agent['sign_many']
 
     Returns:
         dict with 'block' and 'signed' wrapper
@@ -75,7 +81,7 @@ def create_draft(agent, type_, state=None, refs=None):
     refs['agent'] = agent['author_hash']
 
     block = create(type_, state, refs)
-    signed = agent['sign'](block)
+    signed = None if defer_signing else agent['sign'](block)
 
     return {'block': block, 'signed': signed}
 
@@ -97,12 +103,9 @@ def approve_draft(draft_block):
     approved_state = {k: v for k, v in draft_block['state'].items() if k != 'draft'}
 
     # Move agent ref to approved_agent, add updates ref
-    refs = dict(draft_block.get('refs', {}))
-    agent_hash = refs.pop('agent', None)
-    approved_refs = {
-        **refs,
-        'updates': draft_block['hash'],
-    }
+    approved_refs = dict(draft_block.get('refs', {}))
+    agent_hash = approved_refs.pop('agent', None)
+    approved_refs['updates'] = draft_block['hash']
     if agent_hash:
         approved_refs['approved_agent'] = agent_hash
 
@@ -120,7 +123,7 @@ def load_agent(author_hash, keypair):
         keypair: dict with 'public_key' and 'private_key' hex strings
 
     Returns:
-        dict with 'author_hash', 'keypair', 'sign' (callable)
+        dict with 'author_hash', 'keypair', 'sign' and 'sign_many' (callables)
     """
     if not author_hash or not keypair or not keypair.get('private_key'):
         raise ValueError('FoodBlock Agent: author_hash and keypair with private_key are required')
@@ -128,8 +131,12 @@ def load_agent(author_hash, keypair):
     def agent_sign(foodblock):
         return sign(foodblock, author_hash, keypair['private_key'])
 
+    def agent_sign_many(foodblocks):
+        return sign_many(foodblocks, author_hash, keypair['private_key'])
+
     return {
         'author_hash': author_hash,
         'keypair': keypair,
         'sign': agent_sign,
+        'sign_many': agent_sign_many,
     }
@@ -15,29 +15,37 @@ from .block import create, update
 class Registry:
     def __init__(self):
         self._aliases = {}
+        # Same mapping keyed by '@name', so resolve() needs no slicing
+        self._by_ref = {}
 
     def set(self, alias, hash_val):
         """Register an alias for a hash."""
         self._aliases[alias] = hash_val
+        self._by_ref['@' + alias] = hash_val
         return self
 
     def resolve(self, alias_or_hash):
         """Resolve @alias to hash. Pass-through for raw hashes."""
-        if isinstance(alias_or_hash, str) and alias_or_hash.startswith('@'):
-            name = alias_or_hash[1:]
-            if name not in self._aliases:
-                raise ValueError(f'FoodBlock: unresolved alias "@{name}"')
-            return self._aliases[name]
+        if isinstance(alias_or_hash, str) and alias_or_hash[:1] == '@':
+            try:
+                return self._by_ref[alias_or_hash]
+            except KeyError:
+                raise ValueError(f'FoodBlock: unresolved alias "{alias_or_hash}"') from None
         return alias_or_hash
 
     def resolve_refs(self, refs):
         """Resolve all @aliases in a refs dict."""
+        resolve = self.resolve
         resolved = {}
         for key, value in refs.items():
             if isinstance(value, list):
-                resolved[key] = [self.resolve(v) for v in value]
+                # Most refs are raw hashes; copy those lists without per-item calls
+                if any(isinstance(v, str) and v[:1] == '@' for v in value):
+                    resolved[key] = [resolve(v) for v in value]
+                else:
+                    resolved[key] = list(value)
             else:
-                resolved[key] = self.resolve(value)
+                resolved[key] = resolve(value)
         return resolved
 
     def create(self, type, state=None, refs=None, alias=None):
@@ -45,7 +53,7 @@ class Registry:
         resolved_refs = self.resolve_refs(refs or {})
         block = create(type, state or {}, resolved_refs)
         if alias:
-            self._aliases[alias] = block['hash']
+            self.set(alias, block['hash'])
         return block
 
     def update(self, previous_hash, type, state=None, refs=None, alias=None):
@@ -54,7 +62,7 @@ class Registry:
         resolved_refs = self.resolve_refs(refs or {})
         block = update(resolved_prev, type, state or {}, resolved_refs)
         if alias:
-            self._aliases[alias] = block['hash']
+            self.set(alias, block['hash'])
         return block
 
     @property
@@ -9,9 +9,12 @@ Usage:
     d = dispute(bread_hash, whistleblower_hash, reason='Mislabeled organic status')
     info = trace_attestations(bread_hash, all_blocks)
     score = trust_score(bread_hash, all_blocks)
-"""
 
-from datetime import datetime, timezone
+    # Many lookups over the same blocks: index once
+    index = build_attestation_index(all_blocks)
+    info = trace_attestations(bread_hash, index)
+    scores = trust_scores([bread_hash, flour_hash], all_blocks)
+"""
 
 from .block import create
 
@@ -73,16 +76,54 @@ def dispute(target_hash, disputor_hash, reason, **kwargs):
     })
 
 
+def build_attestation_index(all_blocks):
+    """
+    Index attestations and disputes by the hash they target.
+
+    One pass over all_blocks; pass the result to trace_attestations()
+    instead of the block list when querying many hashes.
+
+    Args:
+        all_blocks: list of all known block dicts
+
+    Returns:
+        {target_hash: ([attestation_blocks], [dispute_blocks])}
+    """
+    index = {}
+
+    for block in all_blocks:
+        refs = block.get('refs', {})
+        block_type = block.get('type')
+
+        if block_type == 'observe.attestation':
+            target = refs.get('confirms')
+            slot = 0
+        elif block_type == 'observe.dispute':
+            target = refs.get('challenges')
+            slot = 1
+        else:
+            continue
+
+        if not isinstance(target, str):
+            continue
+        if target not in index:
+            index[target] = ([], [])
+        index[target][slot].append(block)
+
+    return index
+
+
 def trace_attestations(hash_val, all_blocks):
     """
     Find all attestations and disputes for a given block hash.
 
     Scans all_blocks for observe.attestation and observe.dispute blocks
-    whose refs.target matches hash_val.
+    whose refs.confirms / refs.challenges matches hash_val.
 
     Args:
         hash_val: hash of the block to trace
-        all_blocks: list of all known block dicts
+        all_blocks: list of all known block dicts, or an index from
+            build_attestation_index()
 
     Returns:
         {
@@ -91,16 +132,22 @@ def trace_attestations(hash_val, all_blocks):
             'score': int (net trust score),
         }
     """
-    attestations = []
-    disputes = []
-
-    for block in all_blocks:
-        refs = block.get('refs', {})
-
-        if refs.get('confirms') == hash_val and block.get('type') == 'observe.attestation':
-            attestations.append(block)
-        elif refs.get('challenges') == hash_val and block.get('type') == 'observe.dispute':
-            disputes.append(block)
+    if isinstance(all_blocks, dict):
+        attestations, disputes = all_blocks.get(hash_val, ([], []))
+        attestations, disputes = list(attestations), list(disputes)
+    else:
+        attestations = []
+        disputes = []
+
+        for block in all_blocks:
+            # Type is the cheapest discriminator; most blocks stop here
+            block_type = block.get('type')
+            if block_type == 'observe.attestation':
+                if block.get('refs', {}).get('confirms') == hash_val:
+                    attestations.append(block)
+            elif block_type == 'observe.dispute':
+                if block.get('refs', {}).get('challenges') == hash_val:
+                    disputes.append(block)
 
     score = _compute_score(attestations, disputes)
 
@@ -120,7 +167,8 @@ def trust_score(hash_val, all_blocks):
 
     Args:
         hash_val: hash of the block to score
-        all_blocks: list of all known block dicts
+        all_blocks: list of all known block dicts, or an index from
+            build_attestation_index()
 
     Returns:
         int trust score (can be negative)
@@ -129,6 +177,21 @@ def trust_score(hash_val, all_blocks):
     return result['score']
 
 
+def trust_scores(hashes, all_blocks):
+    """
+    Compute trust scores for many blocks with a single pass over all_blocks.
+
+    Args:
+        hashes: iterable of block hashes to score
+        all_blocks: list of all known block dicts
+
+    Returns:
+        {hash: int trust score}
+    """
+    index = build_attestation_index(all_blocks)
+    return {h: _compute_score(*index.get(h, ([], []))) for h in hashes}
+
+
 # Confidence level weights for scoring
 _CONFIDENCE_WEIGHTS = {
     'verified': 3,
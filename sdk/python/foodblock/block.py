@@ -1,11 +1,11 @@
 """Core FoodBlock creation and hashing."""
 
 import hashlib
-import uuid
-from .canonical import canonical
+import os
+from .canonical import canonical_bytes
 
-# Event types that get auto-injected instance_id (Section 2.1)
-_EVENT_PREFIXES = ('transfer.', 'transform.', 'observe.')
+# Event types (transfer.*, transform.*, observe.*) get auto-injected instance_id (Section 2.1)
+_EVENT_ROOTS = frozenset(['transfer', 'transform', 'observe'])
 # Definitional observe.* subtypes excluded from auto-injection
 _DEFINITIONAL = frozenset(['observe.vocabulary', 'observe.template', 'observe.schema', 'observe.trust_policy', 'observe.protocol'])
 
@@ -18,24 +18,48 @@ def create(type_: str, state: dict = None, refs: dict = None) -> dict:
     raw_state = state or {}
 
     # Auto-inject instance_id for event types (Section 2.1)
-    is_event = any(type_.startswith(p) for p in _EVENT_PREFIXES) and type_ not in _DEFINITIONAL
+    root, dot, _ = type_.partition('.')
+    is_event = bool(dot) and root in _EVENT_ROOTS and type_ not in _DEFINITIONAL
     if is_event and 'instance_id' not in raw_state:
-        raw_state = {'instance_id': str(uuid.uuid4()), **raw_state}
+        raw_state = {'instance_id': _uuid4(), **raw_state}
 
     state = _omit_nulls(raw_state)
     refs = _omit_nulls(refs or {})
+    _validate_refs(refs)
 
-    # Validate ref values are strings or lists of strings
+    h = compute_hash(type_, state, refs)
+    return {"hash": h, "type": type_, "state": state, "refs": refs}
+
+
+def _uuid4():
+    """Random UUID v4 string, formatted straight from os.urandom.
+
+    Same output shape as str(uuid.uuid4()) (the spec requires a UUID v4)
+    without building a UUID object per event block.
+    """
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f'{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}'
+
+
+def _validate_refs(refs):
+    """Ref values must be strings or lists of strings."""
     for key, value in refs.items():
+        tv = type(value)
+        if tv is str:
+            continue
+        if tv is list and all(type(v) is str for v in value):
+            continue
+        # Exact-type checks are the fast path; str subclasses (StrEnum
+        # values and the like) are still valid hashes
         if isinstance(value, str):
             continue
         if isinstance(value, list) and all(isinstance(v, str) for v in value):
             continue
         raise ValueError(f"FoodBlock: refs.{key} must be a string or list of strings")
 
-    h = compute_hash(type_, state, refs)
-    return {"hash": h, "type": type_, "state": state, "refs": refs}
-
 
 def update(previous_hash: str, type_: str, state: dict = None, refs: dict = None) -> dict:
     """Create an update block that supersedes a previous block.
@@ -63,18 +87,28 @@ def merge_update(previous_block: dict, state_changes: dict = None, additional_re
     """
     if not previous_block or not previous_block.get("hash"):
         raise ValueError("FoodBlock: previous_block with hash is required")
-    merged_state = {**previous_block["state"], **(state_changes or {})}
+    merged_state = previous_block["state"].copy()
+    if state_changes:
+        merged_state.update(state_changes)
     return update(previous_block["hash"], previous_block["type"], merged_state, additional_refs)
 
 
 def compute_hash(type_: str, state: dict = None, refs: dict = None) -> str:
     """Compute the SHA-256 hash of a FoodBlock's canonical form."""
-    c = canonical(type_, state or {}, refs or {})
-    return hashlib.sha256(c.encode("utf-8")).hexdigest()
+    return hashlib.sha256(canonical_bytes(type_, state or {}, refs or {})).hexdigest()
+
+
+def compute_hashes(items) -> list:
+    """Compute hashes for many (type, state, refs) tuples in one call."""
+    return [hashlib.sha256(canonical_bytes(t, s or {}, r or {})).hexdigest() for t, s, r in items]
 
 
 def _omit_nulls(obj):
-    """Recursively remove None values from an object."""
+    """Recursively remove None values from an object.
+
+    Always returns fresh dicts and lists, so a block never shares state
+    with the caller's input.
+    """
     if not isinstance(obj, dict):
         return obj
     result = {}
@@ -16,56 +16,168 @@ Rules (RFC 8785 + FoodBlock):
 """
 
 from typing import Optional
+import functools
 import unicodedata
 import math
-import json
-import decimal
+from json.encoder import encode_basestring as _encode_string
+
+# Native fast path: orjson (Rust) encodes the prepared tree. Fragment
+# (orjson >= 3.9) is needed to embed ECMAScript-formatted floats verbatim;
+# without it every fractional float would bounce to the slow path.
+try:
+    import orjson
+    if not hasattr(orjson, "Fragment"):
+        orjson = None
+except ImportError:
+    orjson = None
 
 
 def canonical(type_: str, state: dict, refs: dict) -> str:
     obj = {"type": type_, "state": state, "refs": refs}
+    encoded = _orjson_dumps(obj)
+    if encoded is not None:
+        return encoded.decode("utf-8")
     return _stringify(obj, in_refs=False)
 
 
-def _stringify(value, in_refs=False) -> Optional[str]:
-    if value is None:
+def canonical_bytes(type_: str, state: dict, refs: dict) -> bytes:
+    """canonical() as UTF-8 bytes, skipping the str round-trip where possible."""
+    obj = {"type": type_, "state": state, "refs": refs}
+    encoded = _orjson_dumps(obj)
+    if encoded is not None:
+        return encoded
+    return _stringify(obj, in_refs=False).encode("utf-8")
+
+
+def _orjson_dumps(obj) -> Optional[bytes]:
+    if orjson is None:
+        return None
+    try:
+        return orjson.dumps(_prepare(obj, in_refs=False))
+    except (_Fallback, orjson.JSONEncodeError):
+        # Values orjson can't encode byte-identically (ints beyond 64 bits,
+        # keys that collide after NFC) take the pure-Python path.
         return None
 
+
+class _Fallback(Exception):
+    """Raised by _prepare when a value needs the pure-Python serializer."""
+
+
+def _prepare(value, in_refs=False):
+    """Apply the FoodBlock rules to a copy of value so orjson can encode it.
+
+    Nulls are dropped, strings and keys NFC-normalized, keys pre-sorted,
+    string arrays under refs sorted and numbers put in ECMAScript form.
+    """
     if isinstance(value, bool):
-        return "true" if value else "false"
+        return value
 
     if isinstance(value, (int, float)):
-        if isinstance(value, float) and (math.isinf(value) or math.isnan(value)):
-            raise ValueError("FoodBlock: Infinity and NaN are not allowed")
-        return _canonical_number(value)
+        if isinstance(value, float):
+            if math.isinf(value) or math.isnan(value):
+                raise ValueError("FoodBlock: Infinity and NaN are not allowed")
+            if value == int(value) and abs(value) < 2**53:
+                return int(value)
+            return orjson.Fragment(_canonical_number(value))
+        return value
 
     if isinstance(value, str):
-        normalized = unicodedata.normalize("NFC", value)
-        return json.dumps(normalized, ensure_ascii=False)
+        return _nfc(value)
 
     if isinstance(value, list):
-        if in_refs:
-            items = sorted(value) if all(isinstance(v, str) for v in value) else value
-            parts = [_stringify(v, in_refs) for v in items]
-        else:
-            parts = [_stringify(v, in_refs) for v in value]
-        filtered = [p for p in parts if p is not None]
-        return "[" + ",".join(filtered) + "]"
+        if in_refs and all(isinstance(v, str) for v in value):
+            value = sorted(value)
+        return [_prepare(v, in_refs) for v in value if v is not None]
 
     if isinstance(value, dict):
-        keys = sorted(value.keys())
-        parts = []
-        for key in keys:
-            child_in_refs = in_refs or key == "refs"
-            val = _stringify(value[key], child_in_refs)
-            if val is not None:
-                normalized_key = unicodedata.normalize("NFC", key)
-                parts.append(json.dumps(normalized_key, ensure_ascii=False) + ":" + val)
-        return "{" + ",".join(parts) + "}"
+        result = {}
+        for key in sorted(value.keys()):
+            child = value[key]
+            if child is None:
+                continue
+            normalized_key = _nfc(key)
+            if normalized_key in result:
+                raise _Fallback()
+            result[normalized_key] = _prepare(child, in_refs or key == "refs")
+        return result
 
     raise TypeError(f"FoodBlock: unsupported type {type(value)}")
 
 
+def _stringify(value, in_refs=False) -> Optional[str]:
+    if value is None:
+        return None
+
+    # Explicit work stack instead of recursion. Entries are either
+    # (value, in_refs) pairs to serialize or str tokens to emit verbatim;
+    # containers emit their opening token immediately and push children
+    # in reverse so they pop in output order.
+    out = []
+    stack = [(value, in_refs)]
+
+    while stack:
+        item = stack.pop()
+        if type(item) is str:
+            out.append(item)
+            continue
+        value, in_refs = item
+
+        if isinstance(value, bool):
+            out.append("true" if value else "false")
+
+        elif isinstance(value, (int, float)):
+            if isinstance(value, float) and (math.isinf(value) or math.isnan(value)):
+                raise ValueError("FoodBlock: Infinity and NaN are not allowed")
+            out.append(_canonical_number(value))
+
+        elif isinstance(value, str):
+            out.append(_encode_string(_nfc(value)))
+
+        elif isinstance(value, list):
+            if in_refs and all(isinstance(v, str) for v in value):
+                value = sorted(value)
+            items = [v for v in value if v is not None]
+            out.append("[")
+            stack.append("]")
+            for i in range(len(items) - 1, -1, -1):
+                stack.append((items[i], in_refs))
+                if i:
+                    stack.append(",")
+
+        elif isinstance(value, dict):
+            keys = [k for k in sorted(value.keys()) if value[k] is not None]
+            out.append("{")
+            stack.append("}")
+            for i in range(len(keys) - 1, -1, -1):
+                key = keys[i]
+                stack.append((value[key], in_refs or key == "refs"))
+                stack.append(_encode_string(_nfc(key)) + ":")
+                if i:
+                    stack.append(",")
+
+        else:
+            raise TypeError(f"FoodBlock: unsupported type {type(value)}")
+
+    return "".join(out)
+
+
+def _nfc(s: str) -> str:
+    # ASCII is always NFC; that covers hashes, type names and most keys
+    if type(s) is str and s.isascii():
+        return s
+    return _nfc_cached(s)
+
+
+@functools.lru_cache(maxsize=8192)
+def _nfc_cached(s: str) -> str:
+    return unicodedata.normalize("NFC", s)
+
+
+# Counts, quantities and ratings are overwhelmingly small ints
+_SMALL_INTS = tuple(str(i) for i in range(256))
+
+
 def _canonical_number(n) -> str:
     """Format number per ECMAScript Number::toString (RFC 8785 §3.2.2.3).
 
@@ -75,6 +187,8 @@ def _canonical_number(n) -> str:
     - Decimals with |exponent| ≤ 6 → decimal notation
     - Otherwise → scientific notation matching JS format
     """
+    if type(n) is int:
+        return _SMALL_INTS[n] if 0 <= n < 256 else str(n)
     if isinstance(n, float):
         if n == 0.0:
             return "0"
@@ -83,6 +197,7 @@ def _canonical_number(n) -> str:
 
         # Use decimal module for precise control over formatting
         # repr() gives shortest representation, then we reformat per ECMAScript rules
+        import decimal  # only fractional floats get here
         d = decimal.Decimal(repr(n))
         sign, digits, exponent = d.as_tuple()
         num_digits = len(digits)
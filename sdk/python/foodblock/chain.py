@@ -1,7 +1,6 @@
 """Provenance chain traversal."""
 
 from typing import Callable, Optional
-import asyncio
 
 
 async def chain(start_hash: str, resolve: Callable, max_depth: int = 100) -> list:
@@ -110,3 +109,71 @@ async def head(start_hash: str, resolve_forward: Callable, max_depth: int = 1000
         depth += 1
 
     return current
+
+
+class InMemoryStore:
+    """
+    In-process block store for chain walks without resolver overhead.
+
+    Blocks live in a flat list indexed by hash; each block's refs.updates
+    target is pre-extracted into a parallel list, so chain_sync() follows
+    one array instead of digging through nested dicts per hop.
+    """
+
+    def __init__(self, blocks=None):
+        self._index = {}
+        self._blocks = []
+        self._updates = []
+        for block in blocks or []:
+            self.add(block)
+
+    def add(self, block):
+        """Add a block. Blocks already in the store are ignored."""
+        hash_ = block["hash"]
+        if hash_ in self._index:
+            return
+        updates = block.get("refs", {}).get("updates")
+        if isinstance(updates, list):
+            updates = updates[0] if updates else None
+        self._index[hash_] = len(self._blocks)
+        self._blocks.append(block)
+        self._updates.append(updates)
+
+    def get(self, hash_):
+        """Return the block for a hash, or None."""
+        idx = self._index.get(hash_)
+        return None if idx is None else self._blocks[idx]
+
+    async def resolve(self, hash_):
+        """Async resolver for chain(), tree() and friends."""
+        return self.get(hash_)
+
+    def __len__(self):
+        return len(self._blocks)
+
+
+def chain_sync(start_hash: str, store: InMemoryStore, max_depth: int = 100) -> list:
+    """
+    Synchronous chain() over an InMemoryStore.
+    Returns list of blocks from newest to oldest.
+    """
+    index = store._index
+    blocks = store._blocks
+    updates = store._updates
+    visited = set()
+    result = []
+    current = start_hash
+
+    while current and len(result) < max_depth:
+        if current in visited:
+            break
+        visited.add(current)
+
+        idx = index.get(current)
+        if idx is None:
+            break
+
+        result.append(blocks[idx])
+        current = updates[idx]
+
+    return result
@@ -7,33 +7,40 @@ Keys are raw 32-byte format (hex), cross-language compatible with JS SDK.
 See Section 7.2 of the whitepaper.
 """
 
+import functools
 import json
 import os
 import hashlib
+from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey, X25519PublicKey
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-import base64
 
+# pybase64 (SIMD libbase64) is a drop-in for the stdlib codec
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
 
-def generate_encryption_keypair() -> dict:
-    """Generate an X25519 keypair for encryption.
-    Returns { public_key, private_key } as hex strings (raw 32-byte)."""
-    from cryptography.hazmat.primitives import serialization
 
+def generate_encryption_keypair(raw: bool = False) -> dict:
+    """Generate an X25519 keypair for encryption.
+    Returns { public_key, private_key } as hex strings (raw 32-byte),
+    or as the 32-byte values themselves when raw=True."""
     private_key = X25519PrivateKey.generate()
     public_key = private_key.public_key()
 
-    return {
-        "public_key": public_key.public_bytes(
-            serialization.Encoding.Raw,
-            serialization.PublicFormat.Raw
-        ).hex(),
-        "private_key": private_key.private_bytes(
-            serialization.Encoding.Raw,
-            serialization.PrivateFormat.Raw,
-            serialization.NoEncryption()
-        ).hex()
-    }
+    public_bytes = public_key.public_bytes(
+        serialization.Encoding.Raw,
+        serialization.PublicFormat.Raw
+    )
+    private_bytes = private_key.private_bytes(
+        serialization.Encoding.Raw,
+        serialization.PrivateFormat.Raw,
+        serialization.NoEncryption()
+    )
+    if raw:
+        return {"public_key": public_bytes, "private_key": private_bytes}
+    return {"public_key": public_bytes.hex(), "private_key": private_bytes.hex()}
 
 
 def encrypt(value, recipient_public_keys: list) -> dict:
@@ -41,86 +48,145 @@ def encrypt(value, recipient_public_keys: list) -> dict:
 
     Args:
         value: The value to encrypt (will be JSON-serialized)
-        recipient_public_keys: List of recipient X25519 public keys (hex, raw 32-byte)
+        recipient_public_keys: List of recipient X25519 public keys (hex or
+            raw 32-byte bytes)
 
     Returns:
         Encryption envelope per Section 7.2
     """
-    if not recipient_public_keys:
-        raise ValueError("FoodBlock: at least one recipient public key is required")
+    return EncryptSession(recipient_public_keys).encrypt(value)
 
-    plaintext = json.dumps(value).encode("utf-8")
 
-    # Generate random content key and nonce
-    content_key = os.urandom(32)
-    nonce = os.urandom(12)
-
-    # Encrypt the value with the content key (AES-256-GCM)
-    aesgcm = AESGCM(content_key)
-    ciphertext = aesgcm.encrypt(nonce, plaintext, None)
-    ciphertext_b64 = base64.b64encode(ciphertext).decode("ascii")
-
-    # Generate ephemeral X25519 keypair for ECDH
-    from cryptography.hazmat.primitives import serialization
-    eph_private = X25519PrivateKey.generate()
-    eph_public = eph_private.public_key()
-    eph_public_hex = eph_public.public_bytes(
-        serialization.Encoding.Raw,
-        serialization.PublicFormat.Raw
-    ).hex()
+class EncryptSession:
+    """Encrypt many values to one fixed recipient set.
 
-    recipients = []
-    for pub_key_hex in recipient_public_keys:
-        recipient_key = X25519PublicKey.from_public_bytes(bytes.fromhex(pub_key_hex))
+    The ephemeral X25519 key and the per-recipient ECDH secrets are set up
+    once, so each encrypt() only does the content AES-GCM plus one 32-byte
+    key wrap per recipient. Envelopes are the same format as encrypt()
+    produces, but share an ephemeral_key, which links them to each other;
+    use encrypt() when envelopes must be unlinkable.
+    """
 
-        # Derive shared secret via ECDH
-        shared_secret = eph_private.exchange(recipient_key)
+    def __init__(self, recipient_public_keys: list):
+        if not recipient_public_keys:
+            raise ValueError("FoodBlock: at least one recipient public key is required")
 
-        # Use shared secret to encrypt the content key
-        key_nonce = os.urandom(12)
-        key_aesgcm = AESGCM(shared_secret)
-        encrypted_key = key_aesgcm.encrypt(key_nonce, content_key, None)
+        # Generate ephemeral X25519 keypair for ECDH
+        eph_private = X25519PrivateKey.generate()
+        self.ephemeral_key = eph_private.public_key().public_bytes(
+            serialization.Encoding.Raw,
+            serialization.PublicFormat.Raw
+        ).hex()
 
-        # Append key_nonce to encrypted_key for transport
-        encrypted_key_with_nonce = encrypted_key + key_nonce
-        encrypted_key_b64 = base64.b64encode(encrypted_key_with_nonce).decode("ascii")
+        # Derive shared secret per recipient; it wraps the content key
+        self._wraps = []
+        for pub_key in recipient_public_keys:
+            recipient_key, key_hash = _recipient_key(pub_key)
+            shared_secret = eph_private.exchange(recipient_key)
+            self._wraps.append((key_hash, AESGCM(shared_secret)))
+
+    def encrypt(self, value) -> dict:
+        """Encrypt a value to the session's recipients. Returns an envelope."""
+        plaintext = _dumps(value)
+
+        # Content key, content nonce and one key_nonce per recipient, all
+        # random, from a single os.urandom call. Random (not counter)
+        # nonces stay unique across forks and processes sharing a session.
+        rand = os.urandom(44 + 12 * len(self._wraps))
+        content_key = rand[:32]
+        nonce = rand[32:44]
+
+        # Encrypt the value with the content key (AES-256-GCM)
+        ciphertext = AESGCM(content_key).encrypt(nonce, plaintext, None)
+
+        recipients = []
+        for i, (key_hash, key_aesgcm) in enumerate(self._wraps):
+            key_nonce = rand[44 + 12 * i:56 + 12 * i]
+            encrypted_key = key_aesgcm.encrypt(key_nonce, content_key, None)
+
+            # Append key_nonce to encrypted_key for transport
+            recipients.append({
+                "key_hash": key_hash,
+                "encrypted_key": base64.b64encode(encrypted_key + key_nonce).decode("ascii")
+            })
+
+        return {
+            "alg": "x25519-aes-256-gcm",
+            "ephemeral_key": self.ephemeral_key,
+            "recipients": recipients,
+            "nonce": base64.b64encode(nonce).decode("ascii"),
+            "ciphertext": base64.b64encode(ciphertext).decode("ascii")
+        }
+
+
+def _raw_key(key) -> bytes:
+    """Raw 32-byte key from either a hex string or a bytes-like object."""
+    # memoryview() raises TypeError for ints and lists, which bytes() would
+    # quietly turn into zero-filled or element-wise keys
+    return bytes.fromhex(key) if isinstance(key, str) else bytes(memoryview(key))
+
+
+def _recipient_key(pub_key):
+    """(X25519PublicKey, key_hash) for a recipient's public key."""
+    # The cache needs a hashable argument: bytearray/memoryview keys are
+    # turned into bytes first
+    if not isinstance(pub_key, (str, bytes)):
+        pub_key = bytes(memoryview(pub_key))
+    return _load_recipient_key(pub_key)
+
+
+@functools.lru_cache(maxsize=1024)
+def _load_recipient_key(pub_key):
+    """_recipient_key() for a hex str or bytes key, cached per key.
+
+    Producers usually encrypt to the same handful of recipients over and
+    over, so the hex decode, key load and SHA-256 are done once per key.
+    """
+    raw = _raw_key(pub_key)
+    return X25519PublicKey.from_public_bytes(raw), hashlib.sha256(raw).hexdigest()
 
-        key_hash = hashlib.sha256(bytes.fromhex(pub_key_hex)).hexdigest()
 
-        recipients.append({
-            "key_hash": key_hash,
-            "encrypted_key": encrypted_key_b64
-        })
+def prewarm(public_keys) -> None:
+    """Load and hash recipient public keys ahead of the first encrypt().
 
-    return {
-        "alg": "x25519-aes-256-gcm",
-        "ephemeral_key": eph_public_hex,
-        "recipients": recipients,
-        "nonce": base64.b64encode(nonce).decode("ascii"),
-        "ciphertext": ciphertext_b64
-    }
+    Fills the per-key cache used by encrypt(), EncryptSession and decrypt()
+    (up to its 1024 most recent keys). key_hash is a SHA-256 through
+    hashlib, which uses SHA-NI when Python links OpenSSL >= 1.1.1.
+    """
+    for pub_key in public_keys:
+        _recipient_key(pub_key)
 
 
-def decrypt(envelope: dict, private_key_hex: str, public_key_hex: str):
+def decrypt(envelope: dict, private_key_hex, public_key_hex):
     """Decrypt an encryption envelope.
 
     Args:
         envelope: The encryption envelope
-        private_key_hex: Recipient's X25519 private key (hex, raw 32-byte)
-        public_key_hex: Recipient's X25519 public key (hex, for key_hash matching)
+        private_key_hex: Recipient's X25519 private key (hex or raw 32-byte bytes)
+        public_key_hex: Recipient's X25519 public key (hex or bytes, for key_hash matching)
 
     Returns:
         The decrypted value (JSON-parsed)
     """
-    key_hash = hashlib.sha256(bytes.fromhex(public_key_hex)).hexdigest()
-
-    recipient = next((r for r in envelope["recipients"] if r["key_hash"] == key_hash), None)
-    if recipient is None:
+    try:
+        key_hash = _recipient_key(public_key_hex)[1]
+    except ValueError:
+        # Malformed hex still raises from _raw_key; a key X25519 can't load
+        # (wrong length) simply matches no recipient
+        _raw_key(public_key_hex)
+        raise ValueError("FoodBlock: no matching recipient entry found for this key") from None
+
+    # A single pass is already the minimum for one lookup; an index would
+    # cost the same pass to build and envelopes are decrypted once.
+    for recipient in envelope["recipients"]:
+        if recipient["key_hash"] == key_hash:
+            break
+    else:
         raise ValueError("FoodBlock: no matching recipient entry found for this key")
 
     # Reconstruct ephemeral public key
     eph_public = X25519PublicKey.from_public_bytes(bytes.fromhex(envelope["ephemeral_key"]))
-    private_key = X25519PrivateKey.from_private_bytes(bytes.fromhex(private_key_hex))
+    private_key = X25519PrivateKey.from_private_bytes(_raw_key(private_key_hex))
 
     # Derive shared secret
     shared_secret = private_key.exchange(eph_public)
@@ -140,4 +206,16 @@ def decrypt(envelope: dict, private_key_hex: str, public_key_hex: str):
     aesgcm = AESGCM(content_key)
     plaintext = aesgcm.decrypt(content_nonce, ciphertext, None)
 
-    return json.loads(plaintext.decode("utf-8"))
+    return _loads(plaintext)
+
+
+def _dumps(value) -> bytes:
+    # Always json: orjson writes NaN/Infinity as null and natively encodes
+    # datetime/UUID/dataclass values json rejects, which would silently
+    # change what decrypt() returns.
+    return json.dumps(value).encode("utf-8")
+
+
+def _loads(data: bytes):
+    # json as well: orjson parses integers beyond 64 bits as lossy floats
+    return json.loads(data.decode("utf-8"))
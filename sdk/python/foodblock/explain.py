@@ -8,6 +8,9 @@ Usage:
 
 import asyncio
 
+_ACTOR_ROLES = ('seller', 'buyer', 'author', 'operator', 'producer')
+_INPUT_ROLES = ('inputs', 'source', 'origin', 'input')
+
 
 async def explain(hash_val, resolve, max_depth=10):
     """
@@ -21,6 +24,7 @@ async def explain(hash_val, resolve, max_depth=10):
     Returns:
         Human-readable string
     """
+    resolve = _memoize_resolve(resolve)
     block = await resolve(hash_val)
     if not block:
         return f'Block not found: {hash_val}'
@@ -52,30 +56,50 @@ async def _build_narrative(block, resolve, parts, visited, depth, max_depth):
             desc += f' ({state["rating"]}/5)'
         parts.append(desc + '.')
 
+    # Resolve every ref this block mentions in one concurrent round,
+    # then the sellers/sources of its inputs in a second, instead of one
+    # awaited lookup after another. Repeats are served by the memoized
+    # resolve set up in explain().
+    actor_hashes = [h for h in map(refs.get, _ACTOR_ROLES) if h and h not in visited]
+    input_hashes = {
+        role: refs[role] if isinstance(refs[role], list) else [refs[role]]
+        for role in _INPUT_ROLES if role in refs
+    }
+    cert_refs = refs.get('certifications')
+    cert_hashes = (cert_refs if isinstance(cert_refs, list) else [cert_refs]) if cert_refs else []
+
+    resolved = await _resolve_all(
+        resolve, actor_hashes + [h for hs in input_hashes.values() for h in hs] + cert_hashes)
+
+    dep_sources = []
+    for hs in input_hashes.values():
+        for h in hs:
+            dep = resolved[h]
+            if dep and dep.get('state', {}).get('name'):
+                dep_source = (dep.get('refs') or {}).get('seller') or (dep.get('refs') or {}).get('source')
+                if dep_source:
+                    dep_sources.append(dep_source)
+    resolved.update(await _resolve_all(resolve, dep_sources))
+
     # Actor refs
-    for role in ['seller', 'buyer', 'author', 'operator', 'producer']:
-        ref_hash = refs.get(role)
-        if ref_hash and ref_hash not in visited:
-            actor = await resolve(ref_hash)
+    for ref_hash in actor_hashes:
+        if ref_hash not in visited:
+            actor = resolved[ref_hash]
             if actor and actor.get('state', {}).get('name'):
                 visited.add(ref_hash)
                 if depth == 0:
                     parts.append(f'By {actor["state"]["name"]}.')
 
     # Input/source refs
-    for role in ['inputs', 'source', 'origin', 'input']:
-        if role not in refs:
-            continue
-        ref_val = refs[role]
-        ref_hashes = ref_val if isinstance(ref_val, list) else [ref_val]
+    for ref_hashes in input_hashes.values():
         names = []
         for h in ref_hashes:
-            dep = await resolve(h)
+            dep = resolved[h]
             if dep and dep.get('state', {}).get('name'):
                 dep_desc = dep['state']['name']
                 dep_source = (dep.get('refs') or {}).get('seller') or (dep.get('refs') or {}).get('source')
                 if dep_source:
-                    source_actor = await resolve(dep_source)
+                    source_actor = resolved[dep_source]
                     if source_actor and source_actor.get('state', {}).get('name'):
                         dep_desc += f' ({source_actor["state"]["name"]})'
                 names.append(dep_desc)
@@ -83,17 +107,37 @@ async def _build_narrative(block, resolve, parts, visited, depth, max_depth):
             parts.append(f'Made from {", ".join(names)}.')
 
     # Certifications
-    cert_refs = refs.get('certifications')
-    if cert_refs:
-        cert_hashes = cert_refs if isinstance(cert_refs, list) else [cert_refs]
-        for h in cert_hashes:
-            cert = await resolve(h)
-            if cert and cert.get('state', {}).get('name'):
-                cert_desc = f'Certified: {cert["state"]["name"]}'
-                if cert.get('state', {}).get('valid_until'):
-                    cert_desc += f' (expires {cert["state"]["valid_until"]})'
-                parts.append(cert_desc + '.')
+    for h in cert_hashes:
+        cert = resolved[h]
+        if cert and cert.get('state', {}).get('name'):
+            cert_desc = f'Certified: {cert["state"]["name"]}'
+            if cert.get('state', {}).get('valid_until'):
+                cert_desc += f' (expires {cert["state"]["valid_until"]})'
+            parts.append(cert_desc + '.')
 
     # Tombstone
     if state.get('tombstoned'):
         parts.append('This block has been erased.')
+
+
+def _memoize_resolve(resolve):
+    """Wrap resolve so each hash is fetched at most once per explain() call.
+
+    Caches the task rather than the result, so concurrent lookups of the
+    same hash share one backend request.
+    """
+    cache = {}
+
+    async def cached_resolve(h):
+        task = cache.get(h)
+        if task is None:
+            task = cache[h] = asyncio.ensure_future(resolve(h))
+        return await task
+    return cached_resolve
+
+
+async def _resolve_all(resolve, hashes):
+    """Resolve hashes concurrently. Returns {hash: block or None}."""
+    unique = list(dict.fromkeys(hashes))
+    blocks = await asyncio.gather(*(resolve(h) for h in unique))
+    return dict(zip(unique, blocks))
@@ -7,6 +7,8 @@ Usage:
     block = await resolve('a1b2c3...')
 """
 
+from .lru import LRUCache
+
 
 async def discover(server_url, session=None):
     """
@@ -33,7 +35,7 @@ async def discover(server_url, session=None):
         raise ImportError("Install 'requests' or 'aiohttp' for federation support")
 
 
-def federated_resolver(servers, session=None, cache=True):
+def federated_resolver(servers, session=None, cache=True, cache_size=10000):
     """
     Create a resolver that tries multiple servers.
 
@@ -41,15 +43,24 @@ def federated_resolver(servers, session=None, cache=True):
         servers: List of server URLs in priority order
         session: Optional HTTP session
         cache: Whether to cache resolved blocks
+        cache_size: Most blocks kept in the cache, least recently used
+            dropped first. Blocks are content-addressed, so entries
+            never go stale; the bound only caps memory.
 
     Returns:
         async (hash) -> block or None
     """
-    _cache = {} if cache else None
+    _cache = LRUCache(cache_size) if cache else None
+    # Without a session, lookups go through one requests.Session per
+    # resolver, so repeated resolves reuse pooled keep-alive connections
+    sync_session = None
 
     async def resolve(hash_val):
-        if _cache is not None and hash_val in _cache:
-            return _cache[hash_val]
+        nonlocal sync_session
+        if _cache is not None:
+            cached = _cache.get(hash_val)
+            if cached is not None:
+                return cached
 
         for server in servers:
             try:
@@ -62,18 +73,20 @@ def federated_resolver(servers, session=None, cache=True):
                             block = await resp.json()
                             if block and 'error' not in block:
                                 if _cache is not None:
-                                    _cache[hash_val] = block
+                                    _cache.put(hash_val, block)
                                 return block
                 else:
                     # Sync fallback
                     try:
-                        import requests
-                        resp = requests.get(url, timeout=10)
+                        if sync_session is None:
+                            import requests
+                            sync_session = requests.Session()
+                        resp = sync_session.get(url, timeout=10)
                         if resp.status_code == 200:
                             block = resp.json()
                             if block and 'error' not in block:
                                 if _cache is not None:
-                                    _cache[hash_val] = block
+                                    _cache.put(hash_val, block)
                                 return block
                     except ImportError:
                         continue
@@ -13,6 +13,7 @@ Usage:
     # result = {'affected': [...], 'depth': 4, 'paths': [[hash1, hash2, ...], ...]}
 """
 
+import asyncio
 from typing import Callable, Optional
 
 
@@ -52,7 +53,8 @@ async def recall(
 
     Args:
         source_hash: the contaminated/recalled block hash
-        resolve_forward: async function(hash) -> list of blocks referencing this hash
+        resolve_forward: async function(hash) -> list of blocks referencing this hash;
+            called concurrently for all hashes at the same depth
         max_depth: maximum traversal depth (default 50)
         types: optional list of type prefixes to filter (e.g. ['substance'])
         roles: optional list of ref roles to filter
@@ -60,68 +62,73 @@ async def recall(
     Returns:
         {'affected': [blocks], 'depth': int, 'paths': [[hash, ...], ...]}
     """
-    visited = set()
-    visited.add(source_hash)
+    # Each reached block points back to the block it was reached from;
+    # the source is the only block without a parent. Paths are rebuilt
+    # from these pointers for affected blocks only.
+    parent = {source_hash: None}
     affected = []
-    paths = []
     max_depth_seen = 0
 
-    # BFS queue entries: (hash_to_expand, current_depth, path_so_far)
-    queue = [(source_hash, 0, [source_hash])]
-
-    while queue:
-        current_hash, depth, path = queue.pop(0)
-
-        if depth >= max_depth:
-            continue
-
-        children = await resolve_forward(current_hash)
-
-        for block in children:
-            block_hash = block.get("hash")
-            if not block_hash or block_hash in visited:
-                continue
-
-            # Check which ref roles connect back to current_hash
-            refs = block.get("refs", {})
-            matched = False
-            for role, ref in refs.items():
-                hashes = ref if isinstance(ref, list) else [ref]
-                if current_hash in hashes:
-                    if roles and role not in roles:
-                        continue
-                    matched = True
-                    break
-
-            if not matched:
-                continue
-
-            visited.add(block_hash)
-
-            # Apply type prefix filter
-            block_type = block.get("type", "")
-            if types:
-                if not any(block_type.startswith(t) for t in types):
-                    # Still traverse through non-matching types to find
-                    # matching blocks deeper in the graph
-                    new_path = path + [block_hash]
-                    next_depth = depth + 1
-                    queue.append((block_hash, next_depth, new_path))
+    # Level-synchronous BFS: every hash in the frontier is resolved
+    # concurrently, then the results are processed in frontier order,
+    # which visits blocks in the same order as a one-at-a-time queue.
+    frontier = [source_hash]
+    depth = 0
+
+    while frontier and depth < max_depth:
+        results = await asyncio.gather(*(resolve_forward(h) for h in frontier))
+        next_frontier = []
+        next_depth = depth + 1
+
+        for current_hash, children in zip(frontier, results):
+            for block in children:
+                block_hash = block.get("hash")
+                if not block_hash or block_hash in parent:
+                    continue
+
+                # Check which ref roles connect back to current_hash
+                refs = block.get("refs", {})
+                matched = False
+                for role, ref in refs.items():
+                    hashes = ref if isinstance(ref, list) else [ref]
+                    if current_hash in hashes:
+                        if roles and role not in roles:
+                            continue
+                        matched = True
+                        break
+
+                if not matched:
                     continue
 
-            new_path = path + [block_hash]
-            next_depth = depth + 1
+                parent[block_hash] = current_hash
+                next_frontier.append(block_hash)
 
-            affected.append(block)
-            paths.append(new_path)
-            if next_depth > max_depth_seen:
+                # Apply type prefix filter. Non-matching types are still
+                # traversed to find matching blocks deeper in the graph.
+                block_type = block.get("type", "")
+                if types and not any(block_type.startswith(t) for t in types):
+                    continue
+
+                affected.append(block)
                 max_depth_seen = next_depth
 
-            queue.append((block_hash, next_depth, new_path))
+        frontier = next_frontier
+        depth = next_depth
 
+    paths = [_path_to(block["hash"], parent) for block in affected]
     return {"affected": affected, "depth": max_depth_seen, "paths": paths}
 
 
+def _path_to(block_hash: str, parent: dict) -> list:
+    """Source-to-block hash path, following parent pointers back from block_hash."""
+    path = []
+    while block_hash is not None:
+        path.append(block_hash)
+        block_hash = parent[block_hash]
+    path.reverse()
+    return path
+
+
 async def downstream(
     ingredient_hash: str,
     resolve_forward: Callable,
@@ -0,0 +1,43 @@
+"""Bounded least-recently-used cache shared by the SDK's memo tables."""
+
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Mapping of at most maxsize entries; the least recently used is dropped first.
+
+    get() and put() hold a lock, so one cache can be shared across threads.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Value for key (marking it most recently used), or default."""
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def put(self, key, value):
+        """Store value under key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
@@ -31,6 +31,8 @@ def detect_conflict(hash_a, hash_b, resolve):
             'chain_b': [block, ...] from hash_b back to ancestor,
         }
     """
+    resolve = _memoize_resolve(resolve)
+
     if hash_a == hash_b:
         block = resolve(hash_a)
         return {
@@ -40,33 +42,36 @@ def detect_conflict(hash_a, hash_b, resolve):
             'chain_b': [block] if block else [],
         }
 
-    chain_a = _walk_chain(hash_a, resolve)
-    chain_b = _walk_chain(hash_b, resolve)
-
-    hashes_a = {b['hash'] for b in chain_a}
-    hashes_b = {b['hash'] for b in chain_b}
-
-    # Find common ancestor: first hash in chain_a that also appears in chain_b
+    # Walk both chains one block at a time, alternating, and stop at the
+    # first block the other side has already reached. Update chains are
+    # linear, so that block is the common ancestor; nothing above it has
+    # to be fetched.
+    walks = (_iter_chain(hash_a, resolve), _iter_chain(hash_b, resolve))
+    chains = ([], [])
+    seen = (set(), set())
+    active = [True, True]
     common_ancestor = None
-    for block in chain_a:
-        if block['hash'] in hashes_b:
-            common_ancestor = block['hash']
-            break
 
-    # If no common ancestor found searching from a, try from b
-    if common_ancestor is None:
-        for block in chain_b:
-            if block['hash'] in hashes_a:
+    while common_ancestor is None and any(active):
+        for side in (0, 1):
+            if not active[side]:
+                continue
+            block = next(walks[side], None)
+            if block is None:
+                active[side] = False
+                continue
+            chains[side].append(block)
+            seen[side].add(block['hash'])
+            if block['hash'] in seen[1 - side]:
                 common_ancestor = block['hash']
                 break
 
-    # Trim chains to stop at common ancestor
-    trimmed_a = _trim_to_ancestor(chain_a, common_ancestor)
-    trimmed_b = _trim_to_ancestor(chain_b, common_ancestor)
+    # One side may have walked past the ancestor before the other reached it
+    trimmed_a = _trim_to_ancestor(chains[0], common_ancestor)
+    trimmed_b = _trim_to_ancestor(chains[1], common_ancestor)
 
-    is_conflict = (common_ancestor is not None and
-                   hash_a not in hashes_b and
-                   hash_b not in hashes_a)
+    # A head that is the other's ancestor is a fast-forward, not a fork
+    is_conflict = common_ancestor not in (None, hash_a, hash_b)
 
     return {
         'is_conflict': is_conflict,
@@ -90,6 +95,7 @@ def merge(hash_a, hash_b, resolve, state=None, strategy='manual'):
     Returns:
         An observe.merge FoodBlock dict
     """
+    resolve = _memoize_resolve(resolve)
     block_a = resolve(hash_a)
     block_b = resolve(hash_b)
 
@@ -140,6 +146,7 @@ def auto_merge(hash_a, hash_b, resolve, vocabulary=None):
     Returns:
         An observe.merge FoodBlock dict
     """
+    resolve = _memoize_resolve(resolve)
     block_a = resolve(hash_a)
     block_b = resolve(hash_b)
 
@@ -179,10 +186,28 @@ def auto_merge(hash_a, hash_b, resolve, vocabulary=None):
     return merge(hash_a, hash_b, resolve, state=merged_state, strategy='manual')
 
 
-def _walk_chain(start_hash, resolve, max_depth=100):
-    """Walk an update chain backwards, returning list of blocks."""
+def _memoize_resolve(resolve):
+    """Wrap resolve so each hash is fetched at most once per merge operation.
+
+    auto_merge() -> merge() -> detect_conflict() each look up both heads.
+    Already wrapped resolvers are returned as-is, so the cache spans the
+    whole call.
+    """
+    if getattr(resolve, '_memoized', False):
+        return resolve
+    cache = {}
+
+    def cached_resolve(h):
+        if h not in cache:
+            cache[h] = resolve(h)
+        return cache[h]
+    cached_resolve._memoized = True
+    return cached_resolve
+
+
+def _iter_chain(start_hash, resolve, max_depth=100):
+    """Walk an update chain backwards, yielding blocks."""
     visited = set()
-    result = []
     current = start_hash
     depth = 0
 
@@ -195,7 +220,7 @@ def _walk_chain(start_hash, resolve, max_depth=100):
         if not block:
             break
 
-        result.append(block)
+        yield block
 
         refs = block.get('refs', {})
         updates = refs.get('updates')
@@ -206,8 +231,6 @@ def _walk_chain(start_hash, resolve, max_depth=100):
 
         depth += 1
 
-    return result
-
 
 def _trim_to_ancestor(chain_blocks, ancestor_hash):
     """Trim a chain to include blocks up to and including the ancestor."""
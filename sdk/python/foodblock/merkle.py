@@ -12,9 +12,10 @@ Usage:
 
 import hashlib
 import json
-import math
+from json.encoder import encode_basestring_ascii as _encode_str
+from .lru import LRUCache
 
-from .canonical import canonical
+_INF = float('inf')
 
 
 def merkleize(state):
@@ -41,15 +42,8 @@ def merkleize(state):
 
     # Create sorted leaf hashes (sorted by field name for determinism)
     sorted_fields = sorted(state.keys())
-    leaves = {}
-    leaf_hashes = []
-
-    for field in sorted_fields:
-        # Use canonical serialization for the leaf value
-        leaf_data = _canonical_leaf(field, state[field])
-        leaf_hash = hashlib.sha256(leaf_data.encode('utf-8')).hexdigest()
-        leaves[field] = leaf_hash
-        leaf_hashes.append(leaf_hash)
+    leaf_hashes = _leaf_hashes(state, sorted_fields)
+    leaves = dict(zip(sorted_fields, leaf_hashes))
 
     # Build tree layers
     tree = [list(leaf_hashes)]
@@ -89,7 +83,7 @@ def selective_disclose(state, field_names):
             'root': hex string of Merkle root,
         }
     """
-    tree_data = merkleize(state)
+    tree_data = _cached_tree(state)
     disclosed = {f: state[f] for f in field_names if f in state}
 
     sorted_fields = sorted(state.keys())
@@ -133,6 +127,30 @@ def selective_disclose(state, field_names):
     }
 
 
+# Trees of recently disclosed states, keyed by the state's canonical JSON.
+# Disclosing different fields of one block to different parties rebuilds
+# the same tree; serializing the state once is ~10x cheaper than that.
+_TREE_CACHE_SIZE = 256
+_tree_cache = LRUCache(_TREE_CACHE_SIZE)
+
+
+def _cached_tree(state):
+    """merkleize(state), reusing the tree of an identical earlier state.
+
+    Only states whose keys are all str are cached: json.dumps turns other
+    keys into strings, so {9: 'a'} and {'9': 'a'} would share a key while
+    sorting (and so hashing) their fields differently.
+    """
+    if not isinstance(state, dict) or not all(type(k) is str for k in state):
+        return merkleize(state)
+    key = json.dumps(state, sort_keys=True, separators=(',', ':'))
+    tree = _tree_cache.get(key)
+    if tree is None:
+        tree = merkleize(state)
+        _tree_cache.put(key, tree)
+    return tree
+
+
 def verify_proof(disclosed, proof, root):
     """
     Verify a selective disclosure proof.
@@ -152,11 +170,7 @@ def verify_proof(disclosed, proof, root):
         return False
 
     # Hash the disclosed fields
-    disclosed_hashes = []
-    for field in sorted(disclosed.keys()):
-        leaf_data = _canonical_leaf(field, disclosed[field])
-        leaf_hash = hashlib.sha256(leaf_data.encode('utf-8')).hexdigest()
-        disclosed_hashes.append(leaf_hash)
+    disclosed_hashes = _leaf_hashes(disclosed, sorted(disclosed.keys()))
 
     # Reconstruct upward using the proof siblings
     current = disclosed_hashes
@@ -187,8 +201,32 @@ def verify_proof(disclosed, proof, root):
     return len(current) == 1 and current[0] == root
 
 
+def _leaf_hashes(state, fields):
+    """Hash the leaves for fields (in order) in one tight loop."""
+    sha256 = hashlib.sha256
+    leaf = _canonical_leaf
+    return [sha256(leaf(f, state[f]).encode('utf-8')).hexdigest() for f in fields]
+
+
 def _canonical_leaf(field, value):
-    """Serialize a single field for leaf hashing using canonical form."""
+    """Serialize a single field for leaf hashing using canonical form.
+
+    Equal to json.dumps({field: value}, sort_keys=True, separators=(',', ':')).
+    Scalars under a str key, the common case, are formatted directly with
+    the same encoders json uses; everything else goes through json.dumps.
+    """
+    if type(field) is str:
+        vt = type(value)
+        if vt is str:
+            return '{' + _encode_str(field) + ':' + _encode_str(value) + '}'
+        if vt is bool:
+            return '{' + _encode_str(field) + (':true}' if value else ':false}')
+        if vt is int:
+            return '{' + _encode_str(field) + ':' + int.__repr__(value) + '}'
+        if vt is float and value == value and value not in (_INF, -_INF):
+            return '{' + _encode_str(field) + ':' + float.__repr__(value) + '}'
+        if value is None:
+            return '{' + _encode_str(field) + ':null}'
     # Use json with sorted keys for deterministic serialization
     return json.dumps({field: value}, sort_keys=True, separators=(',', ':'))
 
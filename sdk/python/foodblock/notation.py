@@ -11,6 +11,13 @@ Examples:
 import json
 import re
 
+_ALIAS_PATTERN = re.compile(r'^@(\w+)\s*=\s*')
+_TYPE_PATTERN = re.compile(r'^([\w.]+)\s*')
+_UNQUOTED_KEY_PATTERN = re.compile(r'([{,])\s*(\w+)\s*:')
+_TRAILING_COMMA_PATTERN = re.compile(r',\s*}')
+_BRACE_SCAN_PATTERN = re.compile(r'[{}"\\]')
+_REF_SCAN_PATTERN = re.compile(r'[\[\],]')
+
 
 def parse(line):
     """Parse a single FBN line into { alias, type, state, refs }."""
@@ -22,13 +29,13 @@ def parse(line):
     rest = line
 
     # Extract alias
-    alias_match = re.match(r'^@(\w+)\s*=\s*', rest)
+    alias_match = _ALIAS_PATTERN.match(rest)
     if alias_match:
         alias = alias_match.group(1)
         rest = rest[alias_match.end():]
 
     # Extract type
-    type_match = re.match(r'^([\w.]+)\s*', rest)
+    type_match = _TYPE_PATTERN.match(rest)
     if not type_match:
         raise ValueError(f'FBN: expected type in "{line}"')
     block_type = type_match.group(1)
@@ -87,17 +94,20 @@ def format_block(block, alias=None, alias_map=None):
 
 
 def _find_closing_brace(s, start):
+    # Jump between the characters that change brace/string state
     depth = 0
     in_string = False
-    escape = False
-    for i in range(start, len(s)):
+    pos = start
+    while True:
+        match = _BRACE_SCAN_PATTERN.search(s, pos)
+        if not match:
+            raise ValueError('FBN: unmatched brace')
+        i = match.start()
         ch = s[i]
-        if escape:
-            escape = False
-            continue
         if ch == '\\':
-            escape = True
+            pos = i + 2  # skip the escaped character
             continue
+        pos = i + 1
         if ch == '"':
             in_string = not in_string
             continue
@@ -105,17 +115,16 @@ def _find_closing_brace(s, start):
             continue
         if ch == '{':
             depth += 1
-        if ch == '}':
+        else:
             depth -= 1
             if depth == 0:
                 return i
-    raise ValueError('FBN: unmatched brace')
 
 
 def _parse_state(s):
     # Add quotes around unquoted keys
-    normalized = re.sub(r'([{,])\s*(\w+)\s*:', r'\1"\2":', s)
-    normalized = re.sub(r',\s*}', '}', normalized)
+    normalized = _UNQUOTED_KEY_PATTERN.sub(r'\1"\2":', s)
+    normalized = _TRAILING_COMMA_PATTERN.sub('}', normalized)
     try:
         return json.loads(normalized)
     except json.JSONDecodeError:
@@ -141,18 +150,18 @@ def _parse_refs(s):
 
 def _split_ref_parts(s):
     parts = []
-    current = ''
     in_bracket = False
-    for ch in s:
+    last = 0
+    for match in _REF_SCAN_PATTERN.finditer(s):
+        ch = match.group()
         if ch == '[':
             in_bracket = True
-        if ch == ']':
+        elif ch == ']':
             in_bracket = False
-        if ch == ',' and not in_bracket:
-            parts.append(current)
-            current = ''
-        else:
-            current += ch
+        elif not in_bracket:
+            parts.append(s[last:match.start()])
+            last = match.end()
+    current = s[last:]
     if current.strip():
         parts.append(current)
     return parts
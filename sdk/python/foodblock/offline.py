@@ -5,7 +5,6 @@ Blocks are stored locally and synced when connectivity is restored.
 See Section 5.5 of the whitepaper.
 """
 
-import json
 from .block import create, update
 
 
@@ -14,6 +13,9 @@ class OfflineQueue:
 
     def __init__(self):
         self._blocks = []
+        # requests.Session built on the first sync() without a session and
+        # reused afterwards, so retried syncs keep their pooled connections
+        self._session = None
 
     def create(self, type, state=None, refs=None):
         """Create a block and add it to the offline queue."""
@@ -46,7 +48,9 @@ class OfflineQueue:
         Sort blocks in dependency order for sync.
         Blocks that reference other blocks in the queue are placed after their dependencies.
         """
-        hashes = {b['hash'] for b in self._blocks}
+        by_hash = {}
+        for block in self._blocks:
+            by_hash.setdefault(block['hash'], block)
         graph = {}
 
         for block in self._blocks:
@@ -55,65 +59,109 @@ class OfflineQueue:
             for ref in refs.values():
                 ref_hashes = ref if isinstance(ref, list) else [ref]
                 for h in ref_hashes:
-                    if h in hashes:
+                    if h in by_hash:
                         deps.append(h)
             graph[block['hash']] = deps
 
-        # Topological sort
+        # Topological sort: depth-first post-order with an explicit stack,
+        # so long update chains cannot hit the recursion limit
         visited = set()
         result = []
 
-        def visit(h):
-            if h in visited:
-                return
-            visited.add(h)
-            for dep in graph.get(h, []):
-                visit(dep)
-            block = next((b for b in self._blocks if b['hash'] == h), None)
-            if block:
-                result.append(block)
-
         for block in self._blocks:
-            visit(block['hash'])
+            root = block['hash']
+            if root in visited:
+                continue
+            visited.add(root)
+            stack = [(root, iter(graph[root]))]
+            while stack:
+                h, deps = stack[-1]
+                for dep in deps:
+                    if dep not in visited:
+                        visited.add(dep)
+                        stack.append((dep, iter(graph[dep])))
+                        break
+                else:
+                    stack.pop()
+                    result.append(by_hash[h])
 
         return result
 
-    def sync(self, url, session=None):
+    def sync(self, url, session=None, batch_size=500):
         """
         Sync queued blocks to a remote server.
 
         Args:
             url: The FoodBlock server URL (e.g. 'http://localhost:3111')
             session: Optional requests.Session or compatible HTTP client.
-                     Must have a .post(url, json=...) method.
+                     Must have a .post(url, json=...) method. Defaults to a
+                     requests.Session kept on the queue across calls.
+            batch_size: Most blocks sent per request. Batches are posted
+                     one after another in dependency order, so every
+                     block's dependencies reach the server before it does.
+                     If a batch fails, the batches before it have been
+                     acknowledged and are removed from the queue, so a
+                     retry resumes with the failed batch.
 
         Returns:
-            dict with inserted, skipped, failed arrays
+            dict with inserted, skipped, failed arrays (combined across batches)
 
         Raises:
             ImportError if requests is not installed and no session provided
+            ValueError if batch_size is not a positive integer
             Exception on HTTP errors
         """
+        if type(batch_size) is bool or not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError("FoodBlock: batch_size must be a positive integer")
         if session is None:
-            try:
-                import requests
-                session = requests.Session()
-            except ImportError:
-                raise ImportError(
-                    "Install 'requests' for sync support: pip install requests"
-                )
+            if self._session is None:
+                self._session = _requests_session()
+            session = self._session
 
         sorted_blocks = self.sorted()
-        response = session.post(
-            f"{url}/blocks/batch",
-            json={"blocks": sorted_blocks}
-        )
-        response.raise_for_status()
-        result = response.json()
+        result = None
+        acknowledged = set()
+        try:
+            for start in range(0, max(len(sorted_blocks), 1), batch_size):
+                batch = sorted_blocks[start:start + batch_size]
+                response = session.post(
+                    f"{url}/blocks/batch",
+                    json={"blocks": batch}
+                )
+                response.raise_for_status()
+                batch_result = response.json()
+                acknowledged.update(b['hash'] for b in batch)
+                if result is None:
+                    result = batch_result
+                    continue
+                for key, value in batch_result.items():
+                    if isinstance(value, list) and isinstance(result.get(key), list):
+                        result[key].extend(value)
+        except Exception:
+            if acknowledged:
+                self._blocks = [b for b in self._blocks if b['hash'] not in acknowledged]
+            raise
         self.clear()
         return result
 
 
+def _requests_session():
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+    except ImportError:
+        raise ImportError(
+            "Install 'requests' for sync support: pip install requests"
+        )
+    session = requests.Session()
+    # Batch inserts are idempotent (blocks are content-addressed), so
+    # failed connection attempts can safely be retried
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=3)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 def offline_queue():
     """Create a new offline queue."""
     return OfflineQueue()
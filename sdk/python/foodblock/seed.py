@@ -1,5 +1,8 @@
 """FoodBlock Seed Data — vocabularies and templates as actual blocks."""
 
+import copy
+import functools
+
 from .block import create
 from .vocabulary import VOCABULARIES
 from .template import TEMPLATES
@@ -7,6 +10,23 @@ from .template import TEMPLATES
 
 def seed_vocabularies():
     """Generate all vocabulary blocks from built-in definitions."""
+    return [_fresh(block) for block in _vocabulary_blocks()]
+
+
+def seed_templates():
+    """Generate all template blocks from built-in definitions."""
+    return [_fresh(block) for block in _template_blocks()]
+
+
+def seed_all():
+    """Generate all seed blocks (vocabularies + templates)."""
+    return seed_vocabularies() + seed_templates()
+
+
+@functools.lru_cache(maxsize=None)
+def _vocabulary_blocks():
+    # The built-in definitions are constants, so each block is canonicalized
+    # and hashed once; callers get fresh copies via _fresh().
     result = []
     for domain, defn in VOCABULARIES.items():
         state = {
@@ -17,11 +37,11 @@ def seed_vocabularies():
         if 'transitions' in defn:
             state['transitions'] = defn['transitions']
         result.append(create('observe.vocabulary', state))
-    return result
+    return tuple(result)
 
 
-def seed_templates():
-    """Generate all template blocks from built-in definitions."""
+@functools.lru_cache(maxsize=None)
+def _template_blocks():
     result = []
     for key, defn in TEMPLATES.items():
         result.append(create('observe.template', {
@@ -29,9 +49,13 @@ def seed_templates():
             'description': defn['description'],
             'steps': defn['steps'],
         }))
-    return result
+    return tuple(result)
 
 
-def seed_all():
-    """Generate all seed blocks (vocabularies + templates)."""
-    return seed_vocabularies() + seed_templates()
+def _fresh(block):
+    """Deep copy of a cached seed block.
+
+    create() copies its input, so callers got independent blocks when
+    every call built them from scratch; mutating one must not reach the cache.
+    """
+    return copy.deepcopy(block)
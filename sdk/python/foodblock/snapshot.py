@@ -12,6 +12,8 @@ Usage:
     assert result['valid']
 """
 
+import functools
+from collections import Counter
 from datetime import datetime, timezone
 
 from .block import create
@@ -39,14 +41,10 @@ def create_snapshot(blocks, summary=None, date_range=None):
     if not block_hashes:
         raise ValueError("FoodBlock: blocks must contain at least one block with a hash")
 
-    # Build a merkle tree over the block hashes
-    hash_state = {h: h for h in block_hashes}
-    tree = merkleize(hash_state)
-
     stats = summarize(blocks)
 
     state = {
-        'merkle_root': tree['root'],
+        'merkle_root': _merkle_root_for(tuple(sorted(set(block_hashes)))),
         'block_count': len(block_hashes),
         'block_hashes': sorted(block_hashes),
         'by_type': stats['by_type'],
@@ -86,13 +84,11 @@ def verify_snapshot(snapshot, blocks):
 
     missing = sorted(expected_hashes - provided_hashes)
 
-    # Recompute merkle root from the provided blocks that match
-    matching_blocks = [b for b in blocks if b.get('hash') in expected_hashes]
-    if matching_blocks and not missing:
-        matching_hashes = [b['hash'] for b in matching_blocks]
-        hash_state = {h: h for h in matching_hashes}
-        tree = merkleize(hash_state)
-        root_matches = tree['root'] == state.get('merkle_root')
+    # With nothing missing, the provided blocks that match are exactly the
+    # expected set, so the root is recomputed from it without filtering
+    if expected_hashes and not missing:
+        expected_root = _merkle_root_for(tuple(sorted(expected_hashes)))
+        root_matches = expected_root == state.get('merkle_root')
     else:
         root_matches = False
 
@@ -102,6 +98,16 @@ def verify_snapshot(snapshot, blocks):
     }
 
 
+@functools.lru_cache(maxsize=128)
+def _merkle_root_for(hashes):
+    """Merkle root over a sorted tuple of unique block hashes.
+
+    The tree only depends on the hash set, so snapshotting or re-verifying
+    the same blocks reuses the root instead of rehashing every pair.
+    """
+    return merkleize({h: h for h in hashes})['root']
+
+
 def summarize(blocks):
     """
     Summarize a collection of blocks by type.
@@ -115,12 +121,9 @@ def summarize(blocks):
             'by_type': {'substance.product': count, ...},
         }
     """
-    by_type = {}
-    for block in blocks:
-        block_type = block.get('type', 'unknown')
-        by_type[block_type] = by_type.get(block_type, 0) + 1
+    by_type = Counter(block.get('type', 'unknown') for block in blocks)
 
     return {
         'total': len(blocks),
-        'by_type': by_type,
+        'by_type': dict(by_type),
     }
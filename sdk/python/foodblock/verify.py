@@ -1,8 +1,8 @@
 """Ed25519 signing and verification for FoodBlocks."""
 
-from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
 from cryptography.hazmat.primitives import serialization
-from .canonical import canonical
+from .canonical import canonical_bytes
 
 
 def generate_keypair() -> dict:
@@ -26,8 +26,30 @@ def generate_keypair() -> dict:
 def sign(block: dict, author_hash: str, private_key_hex: str) -> dict:
     """Sign a FoodBlock. Returns { foodblock, author_hash, signature }."""
     private_key = Ed25519PrivateKey.from_private_bytes(bytes.fromhex(private_key_hex))
-    content = canonical(block["type"], block["state"], block["refs"])
-    signature = private_key.sign(content.encode("utf-8"))
+    return _sign_with(private_key, block, author_hash)
+
+
+def sign_many(blocks: list, author_hash: str, private_key_hex: str) -> list:
+    """Sign many FoodBlocks with one key. The key is parsed once for the batch."""
+    private_key = Ed25519PrivateKey.from_private_bytes(bytes.fromhex(private_key_hex))
+    return [_sign_with(private_key, block, author_hash) for block in blocks]
+
+
+def verify(wrapper: dict, public_key_hex: str) -> bool:
+    """Verify a signed FoodBlock wrapper. Returns True if valid."""
+    public_key = Ed25519PublicKey.from_public_bytes(bytes.fromhex(public_key_hex))
+    return _verify_with(public_key, wrapper)
+
+
+def verify_many(wrappers: list, public_key_hex: str) -> list:
+    """Verify many wrappers signed by the same key. Returns a list of bools."""
+    public_key = Ed25519PublicKey.from_public_bytes(bytes.fromhex(public_key_hex))
+    return [_verify_with(public_key, wrapper) for wrapper in wrappers]
+
+
+def _sign_with(private_key, block, author_hash):
+    content = canonical_bytes(block["type"], block["state"], block["refs"])
+    signature = private_key.sign(content)
 
     return {
         "foodblock": block,
@@ -37,19 +59,12 @@ def sign(block: dict, author_hash: str, private_key_hex: str) -> dict:
     }
 
 
-def verify(wrapper: dict, public_key_hex: str) -> bool:
-    """Verify a signed FoodBlock wrapper. Returns True if valid."""
-    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
-
-    public_key = Ed25519PublicKey.from_public_bytes(bytes.fromhex(public_key_hex))
+def _verify_with(public_key, wrapper):
     block = wrapper["foodblock"]
-    content = canonical(block["type"], block["state"], block["refs"])
+    content = canonical_bytes(block["type"], block["state"], block["refs"])
 
     try:
-        public_key.verify(
-            bytes.fromhex(wrapper["signature"]),
-            content.encode("utf-8")
-        )
+        public_key.verify(bytes.fromhex(wrapper["signature"]), content)
         return True
     except Exception:
         return False
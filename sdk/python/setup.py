@@ -19,6 +19,9 @@ setup(
     install_requires=[
         "cryptography>=41.0.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.9", "pybase64>=1.0", "pyahocorasick>=2.0"],
+    },
     license="MIT",
     url="https://github.com/FoodXDevelopment/foodblock",
     project_urls={
@@ -1,6 +1,7 @@
 """Tests for advanced FoodBlock Python SDK modules.
 
-Covers: vocabulary, merge, merkle, snapshot, attestation, template, federation.
+Covers: vocabulary, merge, merkle, snapshot, attestation, template, federation, alias,
+explain, offline queue.
 """
 
 import pytest
@@ -11,9 +12,12 @@ from foodblock import (
     detect_conflict, merge, auto_merge,
     merkleize, selective_disclose, verify_proof,
     create_snapshot, verify_snapshot, summarize,
-    attest, dispute, trace_attestations, trust_score,
+    attest, dispute, trace_attestations, trust_score, trust_scores, build_attestation_index,
     create_template, from_template, TEMPLATES,
-    well_known,
+    well_known, federated_resolver,
+    registry,
+    explain,
+    offline_queue,
 )
 
 
@@ -128,6 +132,48 @@ class TestMerge:
         # A wins for conflicting keys
         assert merged["state"]["price"] == 5.0
 
+    def test_auto_merge_resolves_each_hash_once(self):
+        original, v_a, v_b, store = self._make_fork()
+        calls = []
+
+        def resolve(h):
+            calls.append(h)
+            return store(h)
+
+        auto_merge(v_a["hash"], v_b["hash"], resolve)
+        assert sorted(calls) == sorted([original["hash"], v_a["hash"], v_b["hash"]])
+
+    def test_detect_conflict_stops_at_ancestor(self):
+        """Only the blocks down to the fork point are fetched on a long chain."""
+        from foodblock import update
+        head = create("substance.product", {"name": "Bread", "price": 0})
+        blocks = [head]
+        for price in range(1, 50):
+            head = update(head["hash"], "substance.product", {"name": "Bread", "price": price})
+            blocks.append(head)
+        v_a = update(head["hash"], "substance.product", {"name": "Bread", "price": 100})
+        v_b = update(head["hash"], "substance.product", {"name": "Bread", "price": 200})
+        store = _make_store(*blocks, v_a, v_b)
+        calls = []
+
+        def resolve(h):
+            calls.append(h)
+            return store(h)
+
+        result = detect_conflict(v_a["hash"], v_b["hash"], resolve)
+        assert result["is_conflict"] is True
+        assert result["common_ancestor"] == head["hash"]
+        assert [b["hash"] for b in result["chain_a"]] == [v_a["hash"], head["hash"]]
+        assert [b["hash"] for b in result["chain_b"]] == [v_b["hash"], head["hash"]]
+        assert len(calls) == 3
+
+    def test_detect_conflict_fast_forward(self):
+        original, v_a, v_b, store = self._make_fork()
+        result = detect_conflict(v_a["hash"], original["hash"], store)
+        assert result["is_conflict"] is False
+        assert result["common_ancestor"] == original["hash"]
+        assert [b["hash"] for b in result["chain_a"]] == [v_a["hash"], original["hash"]]
+
 
 # ---------------------------------------------------------------------------
 # Merkle tests
@@ -162,6 +208,27 @@ class TestMerkle:
         tampered = {"name": "Cake"}
         assert verify_proof(tampered, result["proof"], result["root"]) is False
 
+    def test_repeated_disclosure_tracks_state(self):
+        state = {"name": "Bread", "price": 4.5, "organic": True}
+        first = selective_disclose(state, ["name"])
+        again = selective_disclose(dict(state), ["name"])
+        assert again == first
+        # A changed value must not reuse the earlier tree
+        changed = selective_disclose({**state, "price": 5}, ["name"])
+        assert changed["root"] == merkleize({**state, "price": 5})["root"]
+        assert changed["root"] != first["root"]
+
+    def test_disclosure_with_non_str_keys_bypasses_tree_cache(self):
+        import sys
+        merkle_module = sys.modules["foodblock.merkle"]
+        merkle_module._tree_cache.clear()
+        numeric = {9: "a", 10: "b"}
+        textual = {"9": "a", "10": "b"}
+        assert selective_disclose(numeric, [9])["root"] == merkleize(numeric)["root"]
+        assert len(merkle_module._tree_cache) == 0
+        assert selective_disclose(textual, ["9"])["root"] == merkleize(textual)["root"]
+        assert len(merkle_module._tree_cache) == 1
+
 
 # ---------------------------------------------------------------------------
 # Snapshot tests
@@ -190,6 +257,25 @@ class TestSnapshot:
         assert result["valid"] is True
         assert result["missing"] == []
 
+    def test_verify_reuses_snapshot_root(self, monkeypatch):
+        import sys
+        snapshot_module = sys.modules["foodblock.snapshot"]
+        calls = []
+        real_merkleize = snapshot_module.merkleize
+
+        def counting_merkleize(state):
+            calls.append(state)
+            return real_merkleize(state)
+
+        monkeypatch.setattr(snapshot_module, "merkleize", counting_merkleize)
+        snapshot_module._merkle_root_for.cache_clear()
+
+        blocks = self._sample_blocks()
+        snap = create_snapshot(blocks)
+        assert verify_snapshot(snap, list(reversed(blocks)))["valid"] is True
+        assert verify_snapshot(snap, blocks + blocks)["valid"] is True
+        assert len(calls) == 1
+
     def test_summarize_counts_by_type(self):
         blocks = self._sample_blocks()
         stats = summarize(blocks)
@@ -243,6 +329,23 @@ class TestAttestation:
         score = trust_score(bread["hash"], all_blocks)
         assert score == 1  # 3 - 2
 
+    def test_trace_attestations_accepts_index(self):
+        bread, inspector, whistleblower = self._setup()
+        a = attest(bread["hash"], inspector["hash"], confidence="verified")
+        d = dispute(bread["hash"], whistleblower["hash"], reason="Bad")
+        all_blocks = [bread, inspector, whistleblower, a, d]
+        index = build_attestation_index(all_blocks)
+        assert trace_attestations(bread["hash"], index) == trace_attestations(bread["hash"], all_blocks)
+        assert trace_attestations(inspector["hash"], index)["score"] == 0
+
+    def test_trust_scores_batch(self):
+        bread, inspector, whistleblower = self._setup()
+        a = attest(bread["hash"], inspector["hash"], confidence="witnessed")  # +2
+        b = attest(inspector["hash"], whistleblower["hash"], confidence="verified")  # +3
+        all_blocks = [bread, inspector, whistleblower, a, b]
+        scores = trust_scores([bread["hash"], inspector["hash"], whistleblower["hash"]], all_blocks)
+        assert scores == {bread["hash"]: 2, inspector["hash"]: 3, whistleblower["hash"]: 0}
+
 
 # ---------------------------------------------------------------------------
 # Template tests
@@ -305,3 +408,235 @@ class TestFederation:
         assert "substance.product" in doc["types"]
         assert "endpoints" in doc
         assert doc["endpoints"]["blocks"] == "/blocks"
+
+    @staticmethod
+    def _session(blocks, calls):
+        """aiohttp-compatible session serving blocks by URL suffix."""
+        class Response:
+            def __init__(self, block):
+                self.status = 200 if block else 404
+                self.block = block
+
+            async def json(self):
+                return self.block
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+        class Session:
+            def get(self, url):
+                calls.append(url)
+                return Response(blocks.get(url.rsplit("/", 1)[-1]))
+
+        return Session()
+
+    def test_resolver_cache_is_bounded(self):
+        import asyncio
+        blocks = {h: {"hash": h} for h in ("a", "b", "c")}
+        calls = []
+        resolve = federated_resolver(["http://s"], self._session(blocks, calls), cache_size=2)
+
+        async def run():
+            for h in ("a", "b", "a", "c", "a", "b"):
+                assert await resolve(h) == {"hash": h}
+        asyncio.run(run())
+        # "a" stays cached as most recently used; "b" was evicted by "c"
+        assert [url.rsplit("/", 1)[-1] for url in calls] == ["a", "b", "c", "b"]
+
+
+# ---------------------------------------------------------------------------
+# Alias registry tests
+# ---------------------------------------------------------------------------
+
+class TestAlias:
+    def test_create_resolves_alias_refs(self):
+        reg = registry()
+        farm = reg.create("actor.producer", {"name": "Green Acres"}, alias="farm")
+        wheat = reg.create("substance.ingredient", {"name": "Wheat"}, {"source": "@farm", "inputs": ["@farm", "abc"]})
+        assert wheat["refs"]["source"] == farm["hash"]
+        assert sorted(wheat["refs"]["inputs"]) == sorted([farm["hash"], "abc"])
+
+    def test_resolve_passes_through_hashes(self):
+        reg = registry()
+        assert reg.resolve("abc123") == "abc123"
+        assert reg.resolve("") == ""
+
+    def test_unresolved_alias_raises(self):
+        reg = registry()
+        with pytest.raises(ValueError, match='unresolved alias "@missing"'):
+            reg.resolve("@missing")
+
+    def test_set_overrides_alias(self):
+        reg = registry().set("farm", "aaa")
+        reg.set("farm", "bbb")
+        assert reg.resolve("@farm") == "bbb"
+        assert reg.aliases == {"farm": "bbb"}
+
+
+# ---------------------------------------------------------------------------
+# Explain
+# ---------------------------------------------------------------------------
+
+class TestExplain:
+    @staticmethod
+    def _graph():
+        farm = create("actor.producer", {"name": "Green Acres Farm"})
+        bakery = create("actor.venue", {"name": "Joes Bakery"})
+        flour = create("substance.ingredient", {"name": "Flour"}, {"seller": farm["hash"]})
+        water = create("substance.ingredient", {"name": "Water"})
+        cert = create("observe.certification", {"name": "Organic", "valid_until": "2027-01-01"})
+        bread = create("substance.product", {"name": "Sourdough", "price": 4.5}, {
+            "seller": bakery["hash"],
+            "producer": bakery["hash"],
+            "inputs": [flour["hash"], water["hash"]],
+            "certifications": cert["hash"],
+        })
+        return bread, [farm, bakery, flour, water, cert, bread]
+
+    @staticmethod
+    def _resolver(blocks, calls):
+        index = {b["hash"]: b for b in blocks}
+
+        async def resolve(h):
+            calls.append(h)
+            return index.get(h)
+        return resolve
+
+    def test_narrative(self):
+        import asyncio
+        bread, blocks = self._graph()
+        story = asyncio.run(explain(bread["hash"], self._resolver(blocks, [])))
+        assert story == (
+            "Sourdough ($4.5). By Joes Bakery. "
+            "Made from Flour (Green Acres Farm), Water. "
+            "Certified: Organic (expires 2027-01-01)."
+        )
+
+    def test_missing_block(self):
+        import asyncio
+        story = asyncio.run(explain("abc", self._resolver([], [])))
+        assert story == "Block not found: abc"
+
+    def test_missing_refs_are_skipped(self):
+        import asyncio
+        block = create("substance.product", {"name": "Jam"}, {"seller": "gone", "inputs": ["gone2"]})
+        story = asyncio.run(explain(block["hash"], self._resolver([block], [])))
+        assert story == "Jam."
+
+    def test_refs_resolved_concurrently(self):
+        import asyncio
+        bread, blocks = self._graph()
+        index = {b["hash"]: b for b in blocks}
+        in_flight = [0, 0]
+
+        async def resolve(h):
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+            await asyncio.sleep(0)
+            in_flight[0] -= 1
+            return index.get(h)
+
+        asyncio.run(explain(bread["hash"], resolve))
+        assert in_flight[1] >= 3
+
+    def test_each_hash_resolved_once(self):
+        import asyncio
+        bakery = create("actor.venue", {"name": "Joes Bakery"})
+        starter = create("substance.ingredient", {"name": "Starter"}, {"seller": bakery["hash"]})
+        bread = create("substance.product", {"name": "Sourdough"}, {
+            "seller": bakery["hash"], "inputs": [starter["hash"]],
+        })
+        calls = []
+        story = asyncio.run(explain(bread["hash"], self._resolver([bakery, starter, bread], calls)))
+        assert story == "Sourdough. By Joes Bakery. Made from Starter (Joes Bakery)."
+        assert sorted(calls) == sorted([bread["hash"], bakery["hash"], starter["hash"]])
+
+
+# ---------------------------------------------------------------------------
+# Offline queue tests
+# ---------------------------------------------------------------------------
+
+class TestOfflineQueue:
+    def test_sorted_places_dependencies_first(self):
+        q = offline_queue()
+        farm = create("actor.producer", {"name": "Farm"})
+        bread = q.create("substance.product", {"name": "Bread"}, {"seller": farm["hash"]})
+        q._blocks.append(farm)
+        newer = q.update(bread["hash"], "substance.product", {"name": "Bread", "price": 5})
+        q._blocks.append(bread)
+
+        ordered = q.sorted()
+        assert [b["hash"] for b in ordered] == [farm["hash"], bread["hash"], newer["hash"]]
+        assert ordered[1] is bread
+
+    def test_sorted_handles_chains_deeper_than_recursion_limit(self):
+        import sys
+        q = offline_queue()
+        block = q.create("substance.product", {"version": 0})
+        for version in range(1, sys.getrecursionlimit() + 100):
+            block = q.update(block["hash"], "substance.product", {"version": version})
+        q._blocks.reverse()
+
+        ordered = q.sorted()
+        assert len(ordered) == q.length
+        assert [b["state"]["version"] for b in ordered] == list(range(q.length))
+
+    class _Response:
+        def __init__(self, blocks, ok=True):
+            self._hashes = [b["hash"] for b in blocks]
+            self._ok = ok
+
+        def raise_for_status(self):
+            if not self._ok:
+                raise RuntimeError("500 Server Error")
+
+        def json(self):
+            return {"inserted": self._hashes, "skipped": [], "failed": []}
+
+    class _Session:
+        def __init__(self, fail_at=None):
+            self.batches = []
+            self._fail_at = fail_at
+
+        def post(self, url, json):
+            self.batches.append(json["blocks"])
+            ok = len(self.batches) != self._fail_at
+            return TestOfflineQueue._Response(json["blocks"], ok)
+
+    @staticmethod
+    def _chain_queue(length):
+        q = offline_queue()
+        block = q.create("substance.product", {"version": 0})
+        for version in range(1, length):
+            block = q.update(block["hash"], "substance.product", {"version": version})
+        return q
+
+    def test_sync_posts_batches_in_dependency_order(self):
+        q = self._chain_queue(5)
+        expected = [b["hash"] for b in q.sorted()]
+
+        session = self._Session()
+        result = q.sync("http://localhost:3111", session=session, batch_size=2)
+        assert [len(batch) for batch in session.batches] == [2, 2, 1]
+        assert result["inserted"] == expected
+        assert q.length == 0
+
+        for batch_size in (0, True):
+            with pytest.raises(ValueError, match="batch_size"):
+                q.sync("http://localhost:3111", session=session, batch_size=batch_size)
+
+    def test_failed_sync_keeps_only_unacknowledged_blocks(self):
+        q = self._chain_queue(5)
+        expected = [b["hash"] for b in q.sorted()]
+
+        with pytest.raises(RuntimeError):
+            q.sync("http://localhost:3111", session=self._Session(fail_at=2), batch_size=2)
+        assert [b["hash"] for b in q.sorted()] == expected[2:]
+
+        retry = self._Session()
+        result = q.sync("http://localhost:3111", session=retry, batch_size=2)
+        assert result["inserted"] == expected[2:]
+        assert q.length == 0
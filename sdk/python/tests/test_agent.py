@@ -3,7 +3,7 @@
 import pytest
 from foodblock import (
     create, create_agent, create_draft, approve_draft, load_agent,
-    generate_keypair, verify, head, query, Query
+    generate_keypair, verify, verify_many, head, query, Query
 )
 
 
@@ -48,6 +48,19 @@ class TestCreateAgent:
         assert signed['signature']
         assert verify(signed, agent['keypair']['public_key'])
 
+    def test_agent_can_sign_many(self):
+        operator = create('actor.producer', {'name': 'Farm'})
+        agent = create_agent('Bot', operator['hash'])
+
+        blocks = [create('substance.product', {'name': n}) for n in ('Bread', 'Cake', 'Pie')]
+        signed = agent['sign_many'](blocks)
+
+        assert [s['foodblock'] for s in signed] == blocks
+        assert verify_many(signed, agent['keypair']['public_key']) == [True, True, True]
+
+        signed[1]['foodblock'] = create('substance.product', {'name': 'Tampered'})
+        assert verify_many(signed, agent['keypair']['public_key']) == [True, False, True]
+
 
 class TestDraftApprove:
     def test_create_draft(self):
@@ -61,6 +74,16 @@ class TestDraftApprove:
         assert result['block']['refs']['agent'] == agent['author_hash']
         assert result['signed']['author_hash'] == agent['author_hash']
 
+    def test_create_draft_deferred_signing(self):
+        operator = create('actor.producer', {'name': 'Farm'})
+        agent = create_agent('Bot', operator['hash'])
+
+        drafts = [create_draft(agent, 'substance.product', {'name': n}, defer_signing=True) for n in ('A', 'B')]
+        assert all(d['signed'] is None for d in drafts)
+
+        signed = agent['sign_many']([d['block'] for d in drafts])
+        assert verify_many(signed, agent['keypair']['public_key']) == [True, True]
+
     def test_approve_draft(self):
         operator = create('actor.producer', {'name': 'Farm'})
         agent = create_agent('Bot', operator['hash'])
@@ -76,6 +99,15 @@ class TestDraftApprove:
         assert approved['refs']['approved_agent'] == agent['author_hash']
         assert 'agent' not in approved['refs']
 
+    def test_approve_draft_validates_refs(self):
+        operator = create('actor.producer', {'name': 'Farm'})
+        agent = create_agent('Bot', operator['hash'])
+        draft = create_draft(agent, 'substance.product', {'name': 'Bread'})['block']
+        draft['refs']['seller'] = 123
+
+        with pytest.raises(ValueError):
+            approve_draft(draft)
+
 
 class TestLoadAgent:
     def test_load_agent(self):
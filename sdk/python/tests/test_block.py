@@ -3,7 +3,8 @@
 import json
 import os
 import pytest
-from foodblock import create, update, compute_hash, canonical, generate_keypair, sign, verify
+from foodblock import create, update, compute_hash, compute_hashes, canonical, canonical_bytes, generate_keypair, sign, verify
+from foodblock.canonical import _stringify
 
 
 VECTORS_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "..", "test", "vectors.json")
@@ -85,6 +86,38 @@ class TestCreate:
             block = create(type_, state)
             assert len(block["hash"]) == 64
 
+    def test_str_subclass_refs_accepted(self):
+        class Hash(str):
+            pass
+
+        block = create("substance.product", {"name": "a"}, {"seller": Hash("ab"), "inputs": [Hash("cd")]})
+        assert block["hash"] == create("substance.product", {"name": "a"}, {"seller": "ab", "inputs": ["cd"]})["hash"]
+        with pytest.raises(ValueError, match="refs.seller must be a string"):
+            create("substance.product", {"name": "a"}, {"seller": 1})
+
+    def test_mutating_input_does_not_change_block(self):
+        state = {"name": "Bread", "price": {"value": 4.5, "unit": "USD"}, "tags": [{"k": "v"}]}
+        refs = {"seller": "abc", "inputs": ["def"]}
+        block = create("substance.product", state, refs)
+        state["name"] = "X"
+        state["price"]["value"] = 9
+        state["tags"][0]["k"] = "changed"
+        refs["seller"] = "xyz"
+        refs["inputs"].append("ghi")
+        assert block["state"] == {"name": "Bread", "price": {"value": 4.5, "unit": "USD"}, "tags": [{"k": "v"}]}
+        assert block["refs"] == {"seller": "abc", "inputs": ["def"]}
+        assert block["hash"] == compute_hash("substance.product", block["state"], block["refs"])
+
+
+class TestComputeHashes:
+    def test_matches_compute_hash(self):
+        items = [
+            ("actor.producer", {"name": "Farm"}, {}),
+            ("substance.product", {"name": "Bread", "price": 4.5}, {"seller": "abc"}),
+            ("test", None, None),
+        ]
+        assert compute_hashes(items) == [compute_hash(*item) for item in items]
+
 
 class TestUpdate:
     def test_creates_update_ref(self):
@@ -131,3 +164,16 @@ class TestVectors:
             assert result == v["expected_canonical"], (
                 f"Canonical '{v['name']}' failed: expected {v['expected_canonical']}, got {result}"
             )
+
+    def test_pure_python_canonical_forms(self):
+        """The fallback serializer must agree with the orjson path."""
+        vectors = load_vectors()
+        for v in vectors:
+            obj = {"type": v["type"], "state": v["state"], "refs": v["refs"]}
+            assert _stringify(obj) == v["expected_canonical"], v["name"]
+
+    def test_canonical_bytes_forms(self):
+        vectors = load_vectors()
+        for v in vectors:
+            result = canonical_bytes(v["type"], v["state"], v["refs"])
+            assert result == v["expected_canonical"].encode("utf-8"), v["name"]
@@ -1,6 +1,7 @@
 """Tests for fb() -- the natural language entry point to FoodBlock."""
 
 import pytest
+from foodblock import create
 from foodblock.fb import fb
 
 
@@ -73,6 +74,11 @@ class TestFbVenue:
         assert "Joe" in result['state']['name'] or "Bakery" in result['state']['name']
         assert result['primary']['type'] == 'actor.venue'
 
+    def test_case_folded_venue_keyword(self):
+        result = fb("Joe's \u017fhop sells bread for \u00a33 and cake for \u00a32")
+        assert result['type'] == 'actor.venue'
+        assert len(result['blocks']) == 3
+
 
 class TestFbReturnShape:
     """Test the return format of fb()."""
@@ -120,6 +126,16 @@ class TestFbValidation:
         with pytest.raises(ValueError, match='fb\\(\\) needs text'):
             fb(42)
 
+    def test_whitespace_only_is_bare_product(self):
+        result = fb(" \n\t")
+        assert result['type'] == 'substance.product'
+        assert result['state'] == {}
+        assert result['confidence'] == 0.4
+        assert result['primary']['hash'] == create('substance.product', {})['hash']
+
+    def test_short_text_still_scored(self):
+        assert fb("on")['type'] == 'actor.venue'
+
 
 class TestFbQuantityExtraction:
     """Test number/unit extraction patterns."""
@@ -144,6 +160,11 @@ class TestFbQuantityExtraction:
         result = fb("farm 100 acres harvest")
         assert result['state']['acreage'] == 100.0
 
+    def test_case_folded_units(self):
+        # IGNORECASE folds dotless i and long s, which lower() keeps
+        assert fb("10 un\u0131ts of flour")['state']['lot_size'] == 10.0
+        assert fb("5 \u017ftars for the bakery")['state']['rating'] == 5.0
+
 
 class TestFbRelationships:
     """Test relationship extraction from prepositions."""
@@ -163,3 +184,104 @@ class TestFbRelationships:
         result = fb("Ordered bread from Downtown Bakery")
         entity_blocks = result['blocks'][1:]
         assert any(b['type'] == 'actor.venue' for b in entity_blocks)
+
+
+class TestFbIntentScoring:
+    """Test intent scoring with and without the Aho-Corasick automaton."""
+
+    TEXTS = [
+        "3 loaves left over today, were £4 each, selling for £1.50, collect by 8pm",
+        "5 stars amazing pizza at luigi's",
+        "reduced to clear, star rated",
+        "nothing to see",
+    ]
+
+    @staticmethod
+    def _expected(lower):
+        from foodblock.fb import INTENTS
+        counts = [sum(1 for signal in intent['signals'] if signal in lower) for intent in INTENTS]
+        return [c * intent['weight'] for c, intent in zip(counts, INTENTS)], counts
+
+    def test_fallback_scan(self, monkeypatch):
+        import sys
+        fb_module = sys.modules['foodblock.fb']
+        monkeypatch.setattr(fb_module, '_SIGNAL_AUTOMATON', None)
+        for text in self.TEXTS:
+            lower = text.lower()
+            assert fb_module._score_intents(lower) == self._expected(lower)
+
+    def test_automaton_matches_scan(self):
+        import sys
+        fb_module = sys.modules['foodblock.fb']
+        if fb_module._SIGNAL_AUTOMATON is None:
+            pytest.skip('pyahocorasick not installed')
+        for text in self.TEXTS:
+            lower = text.lower()
+            assert fb_module._score_intents(lower) == self._expected(lower)
+
+    def test_venue_keywords_are_venue_signals(self):
+        import sys
+        fb_module = sys.modules['foodblock.fb']
+        keywords = set(fb_module.VENUE_KEYWORD_PATTERN.pattern.split('|'))
+        assert keywords <= set(fb_module.INTENTS[fb_module._VENUE_INTENT]['signals'])
+
+
+class TestFbFlagExtraction:
+    """Test vocabulary flag extraction with and without the automaton."""
+
+    TEXTS = [
+        "sourdough bread, $4.50, organic, contains gluten",
+        "vegan gluten free cake with nuts and dairy",
+        "nothing to see",
+    ]
+
+    def test_automaton_matches_scan(self, monkeypatch):
+        import sys
+        fb_module = sys.modules['foodblock.fb']
+        if fb_module._FLAG_AUTOMATON is None:
+            pytest.skip('pyahocorasick not installed')
+        fast = [fb_module._extract_flags(t) for t in self.TEXTS]
+        monkeypatch.setattr(fb_module, '_FLAG_AUTOMATON', None)
+        assert fast == [fb_module._extract_flags(t) for t in self.TEXTS]
+        assert fast[0]['organic'] is True
+
+
+class TestFbResultCache:
+    """Test that repeated inputs are cached without sharing state."""
+
+    def test_repeated_text_returns_fresh_copies(self):
+        text = "Cached sourdough bread, $4.50, organic"
+        results = [fb(text) for _ in range(3)]
+        assert results[0] == results[1] == results[2]
+        assert results[1] is not results[2]
+        assert results[2]['primary'] is results[2]['blocks'][0]
+
+        results[2]['state']['name'] = 'Mutated'
+        assert fb(text)['state']['name'] == 'Cached'
+
+    def test_event_blocks_not_cached(self):
+        text = "Ordered 50kg cached flour"
+        ids = {fb(text)['primary']['state']['instance_id'] for _ in range(3)}
+        assert len(ids) == 3
+
+    def test_hits_keep_text_cached(self, monkeypatch):
+        import sys
+        fb_module = sys.modules['foodblock.fb']
+        monkeypatch.setattr(fb_module, '_result_cache', fb_module.LRUCache(3))
+        monkeypatch.setattr(fb_module, '_seen_texts', fb_module.LRUCache(3))
+        hot = "Hot sourdough bread"
+        fb(hot)
+        fb(hot)
+        for i in range(5):
+            fb(f"Cold rye loaf {i}")
+            fb(f"Cold rye loaf {i}")
+            assert hot in fb_module._result_cache
+            fb(hot)
+
+        # Event results are never cached, so repeats go through _seen_texts
+        event = "Ordered 50kg hot flour"
+        fb(event)
+        for i in range(5):
+            fb(f"Ordered {i}kg cold flour")
+            assert event in fb_module._seen_texts
+            fb(event)
@@ -5,8 +5,8 @@ import asyncio
 from foodblock import (
     create, update, merge_update, compute_hash, canonical,
     generate_keypair, sign, verify,
-    chain, head,
-    encrypt, decrypt, generate_encryption_keypair,
+    chain, head, chain_sync, InMemoryStore,
+    encrypt, decrypt, generate_encryption_keypair, EncryptSession,
     create_agent, create_draft, approve_draft, load_agent,
     tombstone,
     PROTOCOL_VERSION,
@@ -225,6 +225,115 @@ class TestFix14Encryption:
         e3 = encrypt([1, 2, 3], [keys["public_key"]])
         assert decrypt(e3, keys["private_key"], keys["public_key"]) == [1, 2, 3]
 
+    def test_non_finite_floats_roundtrip(self):
+        import math
+        keys = generate_encryption_keypair()
+        envelope = encrypt({"x": float("nan"), "y": float("inf")}, [keys["public_key"]])
+        decrypted = decrypt(envelope, keys["private_key"], keys["public_key"])
+        assert math.isnan(decrypted["x"])
+        assert decrypted["y"] == float("inf")
+
+    def test_big_ints_roundtrip(self):
+        keys = generate_encryption_keypair()
+        value = {"id": 12345678901234567890123, "low": -2**63 - 1}
+        envelope = encrypt(value, [keys["public_key"]])
+        decrypted = decrypt(envelope, keys["private_key"], keys["public_key"])
+        assert decrypted == value
+        assert isinstance(decrypted["id"], int)
+
+    def test_non_json_values_rejected(self):
+        from datetime import datetime
+        keys = generate_encryption_keypair()
+        with pytest.raises(TypeError):
+            encrypt({"at": datetime(2024, 1, 1)}, [keys["public_key"]])
+
+    def test_repeat_recipient_envelopes_are_fresh(self):
+        import hashlib
+        keys = generate_encryption_keypair()
+
+        e1 = encrypt({"x": 1}, [keys["public_key"]])
+        e2 = encrypt({"x": 1}, [keys["public_key"]])
+
+        key_hash = hashlib.sha256(bytes.fromhex(keys["public_key"])).hexdigest()
+        assert e1["recipients"][0]["key_hash"] == key_hash
+        assert e2["recipients"][0]["key_hash"] == key_hash
+        assert e1["ephemeral_key"] != e2["ephemeral_key"]
+        assert e1["recipients"][0]["encrypted_key"] != e2["recipients"][0]["encrypted_key"]
+        assert decrypt(e2, keys["private_key"], keys["public_key"]) == {"x": 1}
+
+    def test_raw_byte_keys(self):
+        keys = generate_encryption_keypair()
+        pub = bytes.fromhex(keys["public_key"])
+        priv = bytes.fromhex(keys["private_key"])
+
+        envelope = encrypt({"x": 1}, [pub])
+        assert decrypt(envelope, keys["private_key"], keys["public_key"]) == {"x": 1}
+        assert decrypt(envelope, priv, pub) == {"x": 1}
+
+        hex_envelope = encrypt({"y": 2}, [keys["public_key"]])
+        assert hex_envelope["recipients"][0]["key_hash"] == envelope["recipients"][0]["key_hash"]
+        assert decrypt(hex_envelope, priv, pub) == {"y": 2}
+
+    def test_non_bytes_keys_rejected(self):
+        keys = generate_encryption_keypair()
+        with pytest.raises(TypeError):
+            encrypt({"x": 1}, [32])
+        with pytest.raises(TypeError):
+            encrypt({"x": 1}, [[1, 2]])
+        envelope = encrypt({"x": 1}, [keys["public_key"]])
+        with pytest.raises(TypeError):
+            decrypt(envelope, 32, keys["public_key"])
+
+    def test_raw_keypair(self):
+        keys = generate_encryption_keypair(raw=True)
+        assert isinstance(keys["public_key"], bytes)
+        assert len(keys["public_key"]) == 32
+        assert len(keys["private_key"]) == 32
+
+        envelope = encrypt({"x": 1}, [keys["public_key"]])
+        assert decrypt(envelope, keys["private_key"], keys["public_key"]) == {"x": 1}
+        assert decrypt(envelope, keys["private_key"].hex(), keys["public_key"].hex()) == {"x": 1}
+
+    def test_bytearray_keys(self):
+        keys = generate_encryption_keypair(raw=True)
+        envelope = encrypt({"x": 1}, [bytearray(keys["public_key"])])
+        private_key = bytearray(keys["private_key"])
+        assert decrypt(envelope, private_key, memoryview(keys["public_key"])) == {"x": 1}
+
+    def test_wrong_length_public_key_matches_no_recipient(self):
+        keys = generate_encryption_keypair()
+        envelope = encrypt({"x": 1}, [keys["public_key"]])
+        with pytest.raises(ValueError, match="no matching recipient"):
+            decrypt(envelope, keys["private_key"], keys["public_key"][:62])
+
+    def test_encrypt_session(self):
+        keys1 = generate_encryption_keypair()
+        keys2 = generate_encryption_keypair()
+        session = EncryptSession([keys1["public_key"], keys2["public_key"]])
+
+        e1 = session.encrypt({"lot": 1})
+        e2 = session.encrypt({"lot": 2})
+
+        assert e1["alg"] == "x25519-aes-256-gcm"
+        assert e1["ephemeral_key"] == e2["ephemeral_key"] == session.ephemeral_key
+        assert e1["nonce"] != e2["nonce"]
+        assert decrypt(e1, keys1["private_key"], keys1["public_key"]) == {"lot": 1}
+        assert decrypt(e2, keys2["private_key"], keys2["public_key"]) == {"lot": 2}
+
+    def test_prewarm_recipient_keys(self):
+        from foodblock.encrypt import prewarm, _load_recipient_key
+        keys = generate_encryption_keypair()
+
+        prewarm([keys["public_key"]])
+        hits = _load_recipient_key.cache_info().hits
+        envelope = encrypt({"x": 1}, [keys["public_key"]])
+        assert _load_recipient_key.cache_info().hits == hits + 1
+        assert decrypt(envelope, keys["private_key"], keys["public_key"]) == {"x": 1}
+
+    def test_encrypt_session_requires_recipients(self):
+        with pytest.raises(ValueError, match="at least one recipient"):
+            EncryptSession([])
+
 
 # ============================================================
 # Fix 3: Canonical number edge cases
@@ -302,3 +411,21 @@ class TestChainTraversal:
 
         result = asyncio.run(chain(blocks[-1]["hash"], resolve, max_depth=5))
         assert len(result) == 5
+
+    def test_chain_sync_matches_chain(self):
+        blocks = [create("test", {"v": 0})]
+        for i in range(1, 6):
+            blocks.append(update(blocks[-1]["hash"], "test", {"v": i}))
+        store = InMemoryStore(blocks)
+
+        expected = asyncio.run(chain(blocks[-1]["hash"], store.resolve))
+        assert chain_sync(blocks[-1]["hash"], store) == expected
+        assert len(chain_sync(blocks[-1]["hash"], store, max_depth=2)) == 2
+        assert chain_sync("missing", store) == []
+
+    def test_in_memory_store_ignores_duplicates(self):
+        v1 = create("test", {"v": 1})
+        store = InMemoryStore([v1, v1])
+        assert len(store) == 1
+        assert store.get(v1["hash"]) is v1
+        assert store.get("missing") is None
@@ -297,6 +297,29 @@ class TestRecall:
         assert len(result["affected"]) == 1
         assert result["affected"][0]["hash"] == "good"
 
+    def test_frontier_resolved_concurrently(self):
+        """recall() resolves all hashes at one depth concurrently."""
+        # src -> a, b, c -> leaf
+        a = make_block("a", "substance.product", {}, {"inputs": ["src"]})
+        b = make_block("b", "substance.product", {}, {"inputs": ["src"]})
+        c = make_block("c", "substance.product", {}, {"inputs": ["src"]})
+        leaf = make_block("leaf", "substance.product", {}, {"inputs": ["a", "b", "c"]})
+        index = build_forward_index([a, b, c, leaf])
+        in_flight = [0, 0]
+
+        async def resolver(h):
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+            await asyncio.sleep(0)
+            in_flight[0] -= 1
+            return index.get(h, [])
+
+        result = asyncio.run(recall("src", resolver))
+
+        assert [blk["hash"] for blk in result["affected"]] == ["a", "b", "c", "leaf"]
+        assert result["paths"][3] == ["src", "a", "leaf"]
+        assert in_flight[1] == 3
+
 
 # ============================================================
 # downstream() tests
@@ -225,6 +225,17 @@ class TestSeedAll:
         hashes = {b['hash'] for b in all_blocks}
         assert len(hashes) == len(all_blocks)
 
+    def test_returns_fresh_blocks(self):
+        first = seed_all()
+        first[0]['state']['domain'] = 'mutated'
+        first[0]['refs']['updates'] = 'mutated'
+        first[0]['state']['for_types'].append('mutated')
+        second = seed_all()
+        assert second[0] is not first[0]
+        assert second[0]['state']['domain'] != 'mutated'
+        assert second[0]['refs'] == {}
+        assert 'mutated' not in second[0]['state']['for_types']
+
 
 # --- Instance_id auto-injection tests ---
 
@@ -237,6 +248,13 @@ class TestInstanceIdAutoInject:
         o = create('observe.review', {'rating': 5})
         assert 'instance_id' in o['state']
 
+    def test_injected_instance_id_is_uuid4(self):
+        import uuid
+        instance_id = create('transfer.order', {'quantity': 5})['state']['instance_id']
+        parsed = uuid.UUID(instance_id)
+        assert parsed.version == 4
+        assert str(parsed) == instance_id
+
     def test_preserves_explicit_instance_id(self):
         block = create('transfer.order', {'instance_id': 'my-id', 'quantity': 5})
         assert block['state']['instance_id'] == 'my-id'